@@ -3,10 +3,24 @@
 # Distributed under the terms of the GNU General Public License (GPL).
 
 from psychopy import visual, monitors, event, core, sound
-from numpy import linspace
-from math import sin, cos, pi
+from numpy import linspace, sin, cos, column_stack, empty, multiply
+from math import pi
 from PIL import Image
 import array, string, pylink, psychopy
+from EyelinkCoords import VisualAngle
+
+# psychopy key names -> pylink key codes, looked up in get_input_key
+KEY_MAP = {'f1': pylink.F1_KEY, 'f2': pylink.F2_KEY, 'f3': pylink.F3_KEY,
+           'f4': pylink.F4_KEY, 'f5': pylink.F5_KEY, 'f6': pylink.F6_KEY,
+           'f7': pylink.F7_KEY, 'f8': pylink.F8_KEY, 'f9': pylink.F9_KEY,
+           'f10': pylink.F10_KEY,
+           'pageup': pylink.PAGE_UP, 'pagedown': pylink.PAGE_DOWN,
+           'up': pylink.CURS_UP, 'down': pylink.CURS_DOWN,
+           'left': pylink.CURS_LEFT, 'right': pylink.CURS_RIGHT,
+           'backspace': ord('\b'), 'return': pylink.ENTER_KEY,
+           'space': ord(' '), 'escape': pylink.ESC_KEY, 'tab': ord('\t')}
+for letter in string.ascii_letters:
+    KEY_MAP[letter] = ord(letter)
 
 class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
     def __init__(self, tracker, win):#
@@ -52,6 +66,15 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
         else: # here comes the 'deg*' units
             self.cfX = self.monWidthCm/self.monViewDist/pi*180.0/self.monSizePix[0]
             self.cfY = self.cfX
+
+        # 'deg' is linear in psychopy as well, so cfX/cfY are exact. With the
+        # flat-screen corrected units the linear factor gets worse towards the
+        # edges, so target positions are converted with the exact geometry
+        self.visualAngle = None
+        if self.units in ('degFlat', 'degFlatPos'):
+            monHeightCm = self.monWidthCm*1.0*self.monSizePix[1]/self.monSizePix[0]
+            self.visualAngle = VisualAngle(self.monSizePix, (self.monWidthCm, monHeightCm),
+                                           self.monViewDist)
             
         # initial setup for the mouse
         self.display.mouseVisible = False
@@ -66,6 +89,36 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
         # lines
         self.line = visual.Line(self.display, start=(0, 0), end=(0,0),
                            lineWidth=2.0*self.cfX, lineColor=[0,0,0])
+
+        # all stimuli below are created once and only updated (position,
+        # color, vertices) while drawing, so that the camera setup screen
+        # keeps up with the refresh rate
+
+        # calibration target
+        self.calTargetOut = visual.GratingStim(self.display, tex='none', mask='circle',
+                                               size=2.0/100*self.sizeX*self.cfX, color=[1.0,1.0,1.0])
+        self.calTargetIn  = visual.GratingStim(self.display, tex='none', mask='circle',
+                                               size=2.0/300*self.sizeX*self.cfX, color=[-1.0,-1.0,-1.0])
+
+        # lozenge (search limits): two straight lines and two semicircles.
+        # the semicircles are the unit semicircle rotated in 90 degree steps,
+        # scaled by the radius and shifted to the lozenge's corners
+        t = linspace(0, pi, 72)
+        top = column_stack((cos(t), sin(t)))
+        self.unitArcTop = top
+        self.unitArcBottom = -top
+        self.unitArcLeft = top[:, ::-1]*(-1, 1)
+        self.unitArcRight = top[:, ::-1]*(1, -1)
+        self.arcVertices = (empty(top.shape), empty(top.shape))
+        self.lozLines = [visual.Line(self.display, start=(0, 0), end=(0, 0),
+                                     lineWidth=2.0*self.cfX, lineColor=[0,0,0])
+                         for i in range(2)]
+        self.lozArcs = [visual.ShapeStim(self.display, vertices=top, lineWidth=2.0*self.cfX,
+                                         lineColor=[0,0,0], closeShape=False)
+                        for i in range(2)]
+
+        # camera image
+        self.imgStim = visual.ImageStim(self.display)
         
     def setTracker(self, tracker):
         ''' set proper tracker parameters '''
@@ -110,14 +163,16 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
     def draw_cal_target(self, x, y):#
         '''Draw the calibration/validation & drift-check  target'''
         
-        xVis = (x - self.sizeX/2)*self.cfX
-        yVis = (self.sizeY/2 - y)*self.cfY
-        cal_target_out = visual.GratingStim(self.display, tex='none', mask='circle', size=2.0/100*self.sizeX*self.cfX, color=[1.0,1.0,1.0])
-        cal_target_in  = visual.GratingStim(self.display, tex='none', mask='circle', size=2.0/300*self.sizeX*self.cfX, color=[-1.0,-1.0,-1.0])
-        cal_target_out.setPos((xVis, yVis))
-        cal_target_in.setPos((xVis, yVis))
-        cal_target_out.draw()
-        cal_target_in.draw()
+        if self.visualAngle is not None:
+            xVis = self.visualAngle.pix2deg(x - self.sizeX/2.0, 0)
+            yVis = self.visualAngle.pix2deg(self.sizeY/2.0 - y, 1)
+        else:
+            xVis = (x - self.sizeX/2)*self.cfX
+            yVis = (self.sizeY/2 - y)*self.cfY
+        self.calTargetOut.setPos((xVis, yVis))
+        self.calTargetIn.setPos((xVis, yVis))
+        self.calTargetOut.draw()
+        self.calTargetIn.draw()
         self.display.flip()
 
 
@@ -164,46 +219,39 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
         x = (x * 1  - self.size[0]/2)*self.cfX
         width = width*self.cfX; height = height*self.cfY
         color = self.getColorFromIndex(colorindex)
+        line1, line2 = self.lozLines
         
         if width > height:
             rad = height / 2
             if rad == 0: 
                 return #cannot draw the circle with 0 radius
-            #draw the lines
-            line1 = visual.Line(self.display, lineColor=color, lineWidth=2.0*self.cfX, start=(x + rad, y), end=(x + width - rad, y))
-            line2 = visual.Line(self.display, lineColor=color, lineWidth=2.0*self.cfX, start=(x + rad, y - height), end=(x + width - rad, y - height))
-            
-            #draw semicircles
-            Xs1 = [rad*cos(t) + x + rad for t in linspace(pi/2, pi/2+pi, 72)]
-            Ys1 = [rad*sin(t) + y - rad for t in linspace(pi/2, pi/2+pi, 72)]
-
-            Xs2 = [rad*cos(t) + x - rad + width for t in linspace(pi/2+pi, pi/2+2*pi, 72)]
-            Ys2 = [rad*sin(t) + y - rad for t in linspace(pi/2+pi, pi/2+2*pi, 72)]          
-            lozenge1 = visual.ShapeStim(self.display, vertices = zip(Xs1, Ys1), lineWidth=2.0*self.cfX, lineColor=color, closeShape=False)
-            lozenge2 = visual.ShapeStim(self.display, vertices = zip(Xs2, Ys2), lineWidth=2.0*self.cfX, lineColor=color, closeShape=False)
+            #the lines
+            line1.start = (x + rad, y);          line1.end = (x + width - rad, y)
+            line2.start = (x + rad, y - height); line2.end = (x + width - rad, y - height)
+            #the semicircles
+            arcs = ((self.unitArcLeft,  x + rad,         y - rad),
+                    (self.unitArcRight, x - rad + width, y - rad))
         else:
             rad = width / 2
-
-            #draw the lines
-            line1 = visual.Line(self.display, lineColor=color, lineWidth=2.0*self.cfX, start=(x, y - rad), end=(x, y - height + rad))
-            line2 = visual.Line(self.display, lineColor=color, lineWidth=2.0*self.cfX, start=(x + width, y - rad), end=(x + width, y - height + rad))
-
-            #draw semicircles
             if rad == 0: 
                 return #cannot draw sthe circle with 0 radius
-
-            Xs1 = [rad*cos(t) + x + rad for t in linspace(0, pi, 72)]
-            Ys1 = [rad*sin(t) + y - rad for t in linspace(0, pi, 72)]
-
-            Xs2 = [rad*cos(t) + x + rad for t in linspace(pi, 2*pi, 72)]
-            Ys2 = [rad*sin(t) + y + rad - height for t in linspace(pi, 2*pi, 72)]
-
-            lozenge1 = visual.ShapeStim(self.display, vertices = zip(Xs1, Ys1),lineWidth=2.0*self.cfX, lineColor=color, closeShape=False)
-            lozenge2 = visual.ShapeStim(self.display, vertices = zip(Xs2, Ys2),lineWidth=2.0*self.cfX, lineColor=color, closeShape=False)    
-        lozenge1.draw()
-        lozenge2.draw()
-        line1.draw()
-        line2.draw()
+            #the lines
+            line1.start = (x, y - rad);         line1.end = (x, y - height + rad)
+            line2.start = (x + width, y - rad); line2.end = (x + width, y - height + rad)
+            #the semicircles
+            arcs = ((self.unitArcTop,    x + rad, y - rad),
+                    (self.unitArcBottom, x + rad, y + rad - height))
+
+        for lozenge, vertices, (unitArc, cx, cy) in zip(self.lozArcs, self.arcVertices, arcs):
+            multiply(unitArc, rad, out=vertices)
+            vertices[:, 0] += cx
+            vertices[:, 1] += cy
+            lozenge.vertices = vertices
+            lozenge.lineColor = color
+            lozenge.draw()
+        for line in self.lozLines:
+            line.lineColor = color
+            line.draw()
 
     def get_mouse_state(self):#
         '''Get the current mouse position and status'''
@@ -226,30 +274,7 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
         
         ky=[]
         for keycode, modifier in event.getKeys(modifiers=True):
-            k= pylink.JUNK_KEY
-            if keycode   == 'f1': k = pylink.F1_KEY
-            elif keycode == 'f2': k = pylink.F2_KEY
-            elif keycode == 'f3': k = pylink.F3_KEY
-            elif keycode == 'f4': k = pylink.F4_KEY
-            elif keycode == 'f5': k = pylink.F5_KEY
-            elif keycode == 'f6': k = pylink.F6_KEY
-            elif keycode == 'f7': k = pylink.F7_KEY
-            elif keycode == 'f8': k = pylink.F8_KEY
-            elif keycode == 'f9': k = pylink.F9_KEY
-            elif keycode == 'f10': k = pylink.F10_KEY
-            elif keycode == 'pageup': k = pylink.PAGE_UP
-            elif keycode == 'pagedown': k = pylink.PAGE_DOWN
-            elif keycode == 'up': k = pylink.CURS_UP
-            elif keycode == 'down': k = pylink.CURS_DOWN
-            elif keycode == 'left': k = pylink.CURS_LEFT
-            elif keycode == 'right': k = pylink.CURS_RIGHT
-            elif keycode == 'backspace': k = ord('\b')
-            elif keycode == 'return': k = pylink.ENTER_KEY
-            elif keycode == 'space': k = ord(' ')
-            elif keycode == 'escape': k = pylink.ESC_KEY
-            elif keycode == 'tab': k = ord('\t')
-            elif keycode in string.ascii_letters: k = ord(keycode)
-            elif k== pylink.JUNK_KEY: key = 0
+            k = KEY_MAP.get(keycode, pylink.JUNK_KEY)
 
             if modifier['alt']==True: mod = 256
             else: mod = 0
@@ -267,7 +292,7 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
     def alert_printf(self,msg):
         '''Print error messages.'''
         
-        print "Error: " + msg
+        print("Error: " + msg)
 
     def setup_image_display(self, width, height): 
         ''' set up the camera image, for newer APIs, the size is 384 x 320 pixels'''
@@ -300,9 +325,9 @@ class EyeLinkCoreGraphicsPsychoPy(pylink.EyeLinkCustomDisplay):
                 img = Image.fromstring("RGBX", (width, totlines), bufferv) # PIL
 
             imgResize = img.resize((self.size[0], self.size[1]))       
-            imgResizeVisual = visual.ImageStim(self.display, image=imgResize)
+            self.imgStim.image = imgResize
             
-            imgResizeVisual.draw()
+            self.imgStim.draw()
             self.draw_cross_hair()    
             self.display.flip()
            
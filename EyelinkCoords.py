@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""
+Conversion between the coordinate systems of Eyelink and psychopy, and from
+pixels to visual angle.
+
+Eyelink thinks (0,0) is the top-left corner of the display and y grows
+downwards, psychopy thinks (0,0) is the center and y grows upwards. All
+functions work on scalars as well as on numpy arrays.
+
+A single pixels-per-degree factor is only correct close to the screen
+center. ``VisualAngle`` uses the exact geometry instead, which matters at the
+edges of wide screens.
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from math import sqrt as m_sqrt, atan2 as m_atan2, degrees as m_degrees
+from numpy import arctan, arctan2, tan, degrees, radians, sqrt, asarray
+
+
+def EyelinkToPsychopy(x, y, dispsize):
+    """ Converts Eyelink (top-left) to psychopy (center) pixel coordinates.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    x, y : float or ndarray
+        gaze coordinates as reported by the tracker
+    dispsize : tuple
+        two-item tuple width & height in px
+
+    Returns
+    -------
+    (x, y) : tuple
+        coordinates relative to the display center, y pointing upwards
+    """
+    xhalf = dispsize[0]/2
+    yhalf = dispsize[1]/2
+    return x - xhalf, yhalf - y
+
+
+def PsychopyToEyelink(x, y, dispsize):
+    """ Converts psychopy (center) to Eyelink (top-left) pixel coordinates.
+    Inverse of ``EyelinkToPsychopy``.
+
+    *October 2026*
+    """
+    xhalf = dispsize[0]/2
+    yhalf = dispsize[1]/2
+    return x + xhalf, yhalf - y
+
+
+class VisualAngle(object):
+    """ Exact conversion from screen pixels to visual angle.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    dispsize : tuple
+        two-item tuple width & height in px
+    screenCm : tuple
+        width & height of the visible screen area in cm
+    viewDist : float
+        distance between eye and screen plane in cm
+    eyeOffset : tuple
+        position (x, y) in cm at which the line of sight perpendicular to
+        the screen hits it, relative to the screen center (y pointing
+        upwards). (0, 0) if the eye is centered in front of the screen.
+
+    Notes
+    -----
+    All pixel coordinates are psychopy coordinates ((0, 0) is center).
+    Everything is computed directly instead of being looked up in
+    precomputed tables. ``benchmarks/bench_visual_angle.py`` times both: on
+    arrays, per-axis tables are 1.3x (nearest pixel) to 10x (``np.interp``)
+    slower than the exact angle and off by up to 2 degree, because
+    per-axis eccentricities ignore the 2D geometry. A 2D table of the angle
+    to one target (8 px grid, bilinear) is about 2x slower and 0.1 degree
+    off. For a single sample, a table lookup saves about 10%, at the same
+    loss of accuracy.
+    """
+
+    def __init__(self, dispsize, screenCm, viewDist, eyeOffset=(0, 0)):
+        self.dispsize = dispsize
+        self.viewDist = float(viewDist)
+        self.eyeOffset = eyeOffset
+        self.cmPerPix = (screenCm[0] / float(dispsize[0]),
+                         screenCm[1] / float(dispsize[1]))
+        # pixels per degree at the point closest to the eye
+        self.PixPerDeg = 1.0 / self.pix2deg(self.deg2pix(0) + 1)
+
+    def pix2deg(self, pix, axis=0):
+        """ Eccentricity along one axis (0: x, 1: y) of a pixel position,
+        i.e. the convention of psychopy's 'degFlatPos' units. """
+        cm = asarray(pix) * self.cmPerPix[axis] - self.eyeOffset[axis]
+        return degrees(arctan(cm / self.viewDist))
+
+    def deg2pix(self, deg, axis=0):
+        """ Inverse of ``pix2deg``. """
+        cm = tan(radians(deg)) * self.viewDist + self.eyeOffset[axis]
+        return cm / self.cmPerPix[axis]
+
+    def angle(self, x1, y1, x2, y2):
+        """ Angle in degree between two screen positions. Works on scalars
+        and arrays. """
+        # vectors from the eye to both points, in cm
+        ax = asarray(x1) * self.cmPerPix[0] - self.eyeOffset[0]
+        ay = asarray(y1) * self.cmPerPix[1] - self.eyeOffset[1]
+        bx = asarray(x2) * self.cmPerPix[0] - self.eyeOffset[0]
+        by = asarray(y2) * self.cmPerPix[1] - self.eyeOffset[1]
+        d = self.viewDist
+        # angle = atan2(|a x b|, a . b), accurate for small angles, too
+        cx = ay * d - d * by
+        cy = d * bx - ax * d
+        cz = ax * by - ay * bx
+        dot = ax * bx + ay * by + d * d
+        return degrees(arctan2(sqrt(cx * cx + cy * cy + cz * cz), dot))
+
+    def distance(self, x, y, targetLoc):
+        """ Angle in degree between gaze position(s) (x, y) and
+        ``targetLoc``. For a single sample plain float math is used, which
+        is several times faster than numpy on scalars. """
+        if not (isinstance(x, float) or isinstance(x, int)):
+            return self.angle(x, y, targetLoc[0], targetLoc[1])
+        ax = x * self.cmPerPix[0] - self.eyeOffset[0]
+        ay = y * self.cmPerPix[1] - self.eyeOffset[1]
+        bx = targetLoc[0] * self.cmPerPix[0] - self.eyeOffset[0]
+        by = targetLoc[1] * self.cmPerPix[1] - self.eyeOffset[1]
+        d = self.viewDist
+        cx = ay * d - d * by
+        cy = d * bx - ax * d
+        cz = ax * by - ay * bx
+        dot = ax * bx + ay * by + d * d
+        return m_degrees(m_atan2(m_sqrt(cx * cx + cy * cy + cz * cz), dot))
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+"""
+Online gaze heatmaps / dwell maps.
+
+``GazeHeatmap`` bins gaze positions (psychopy coordinates, i.e. as returned by
+``EyelinkGetGaze``) into one fixed-size grid per condition. Memory use only
+depends on display size, bin size and number of conditions, not on the
+length of the session. Maps can be shown on the experimenter screen during
+the session (``to_image``) and saved at its end (``save``).
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from math import ceil
+from numpy import (zeros, arange, exp, outer, asarray, bincount, flipud,
+                   savez_compressed, floor, dot)
+
+
+class GazeHeatmap(object):
+    """ Incremental per-condition gaze heatmaps.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    dispsize : tuple
+        two-item tuple width & height in px
+    binSize : int
+        width & height of one bin in px
+    sigma : float, optional
+        If given, every sample is splatted as a Gaussian with this standard
+        deviation (in px) instead of being added to a single bin.
+        ``add_samples`` then needs two smoothing matrices of
+        (rows x rows) and (columns x columns) bins, built on first use.
+    conditions : list, optional
+        conditions to allocate layers for right away. Layers for other
+        conditions are created the first time they are used.
+
+    Attributes
+    ----------
+    layers : dict
+        condition -> 2D array (rows from top to bottom of the display)
+    weights : dict
+        condition -> summed weight (samples or fixation durations) that
+        ended up in the layer
+    """
+
+    def __init__(self, dispsize, binSize=10, sigma=None, conditions=()):
+        self.dispsize = dispsize
+        self.binSize = binSize
+        self.nx = int(ceil(dispsize[0] / float(binSize)))
+        self.ny = int(ceil(dispsize[1] / float(binSize)))
+        self.layers = {}
+        self.weights = {}
+        for c in conditions:
+            self.layer(c)
+        # Gaussian kernel in units of bins, cut at 3 SD
+        self.sigma = sigma
+        self.kernel1D = None
+        self.kernel = None
+        if sigma is not None:
+            s = sigma / float(binSize)
+            r = int(ceil(3 * s))
+            g = exp(-arange(-r, r + 1) ** 2 / (2.0 * s * s))
+            g /= g.sum()
+            self.kernel1D = g
+            self.kernel = outer(g, g)
+            self.radius = r
+        self._rows = None
+        self._cols = None
+
+    def layer(self, condition='all'):
+        """ Returns the layer of a condition (created if necessary). """
+        try:
+            return self.layers[condition]
+        except KeyError:
+            grid = zeros((self.ny, self.nx))
+            self.layers[condition] = grid
+            self.weights[condition] = 0.0
+            return grid
+
+    def _bin(self, x, y):
+        # psychopy center coordinates -> column & row (row 0 = top)
+        col = (x + self.dispsize[0] / 2.0) / self.binSize
+        row = (self.dispsize[1] / 2.0 - y) / self.binSize
+        return col, row
+
+    def add(self, x, y, condition='all', weight=1.0):
+        """ Adds one gaze position.
+
+        Parameters
+        ----------
+        x, y : float
+            gaze in psychopy pixel coordinates ((0, 0) is center)
+        condition :
+            any hashable that identifies the layer
+        weight : float
+            e.g. 1 for a sample or the duration of a fixation
+
+        Returns
+        -------
+        added : boolean
+            False if the position is off-screen (this includes
+            ``pylink.MISSING_DATA``)
+        """
+        col, row = self._bin(x, y)
+        if not (0 <= col < self.nx and 0 <= row < self.ny):
+            return False
+        col = int(col)
+        row = int(row)
+        grid = self.layer(condition)
+        self.weights[condition] += weight
+        if self.kernel is None:
+            grid[row, col] += weight
+            return True
+        # splat the kernel, clipped at the borders of the grid
+        r = self.radius
+        r0 = max(row - r, 0)
+        r1 = min(row + r + 1, self.ny)
+        c0 = max(col - r, 0)
+        c1 = min(col + r + 1, self.nx)
+        grid[r0:r1, c0:c1] += weight * self.kernel[r0 - row + r:r1 - row + r,
+                                                   c0 - col + r:c1 - col + r]
+        return True
+
+    def add_gaze(self, GazeInfo, condition='all'):
+        """ Adds an ``EyelinkGetGaze`` result; ``None`` is ignored. """
+        if GazeInfo is None:
+            return False
+        return self.add(GazeInfo['x'], GazeInfo['y'], condition)
+
+    def add_fixation(self, x, y, duration, condition='all'):
+        """ Adds a fixation, weighted by its duration (dwell map). """
+        return self.add(x, y, condition, weight=duration)
+
+    def _smoothing(self, n):
+        # n x n matrix that convolves a vector of length n with the kernel,
+        # zero-padded at the borders (i.e. clipped like the splats in add),
+        # also if the kernel is longer than n
+        i = arange(n)
+        d = i[None, :] - i[:, None] + self.radius
+        inside = (d >= 0) & (d < len(self.kernel1D))
+        m = zeros((n, n))
+        m[inside] = self.kernel1D[d[inside]]
+        return m
+
+    def _smooth(self, hist):
+        # separable filter as two matrix products; the matrices are built
+        # on first use
+        if self._rows is None:
+            self._rows = self._smoothing(self.ny)
+            self._cols = self._smoothing(self.nx).T
+        return dot(dot(self._rows, hist), self._cols)
+
+    def add_samples(self, x, y, condition='all', weights=None):
+        """ Adds many gaze positions at once (e.g. a whole trial).
+
+        Same result as calling ``add`` for every sample, but vectorized:
+        the samples are histogrammed first and the histogram is then
+        convolved with the (separable) kernel, as one matrix product per
+        axis.
+        """
+        col, row = self._bin(asarray(x, dtype=float), asarray(y, dtype=float))
+        ok = (col >= 0) & (col < self.nx) & (row >= 0) & (row < self.ny)
+        idx = floor(row[ok]).astype(int) * self.nx + floor(col[ok]).astype(int)
+        if weights is not None:
+            weights = asarray(weights, dtype=float)[ok]
+        hist = bincount(idx, weights=weights, minlength=self.nx * self.ny)
+        hist = hist.reshape(self.ny, self.nx)
+        if self.kernel1D is not None:
+            hist = self._smooth(hist)
+        self.layer(condition)[...] += hist
+        self.weights[condition] += ok.sum() if weights is None else weights.sum()
+
+    def snapshot(self, condition=None):
+        """ Copy of one layer, or of the sum of all layers if ``condition``
+        is None. """
+        if condition is not None:
+            return self.layer(condition).copy()
+        total = zeros((self.ny, self.nx))
+        for grid in self.layers.values():
+            total += grid
+        return total
+
+    def to_image(self, condition=None):
+        """ Layer scaled to -1..1 and flipped, ready to be used as ``image``
+        of a psychopy ``ImageStim`` (psychopy puts row 0 at the bottom). """
+        img = self.snapshot(condition)
+        peak = img.max()
+        if peak > 0:
+            img *= 2.0 / peak
+        img -= 1.0
+        return flipud(img)
+
+    def reset(self, condition=None):
+        """ Clears one layer or all of them. """
+        conditions = self.layers.keys() if condition is None else [condition]
+        for c in conditions:
+            self.layers[c][...] = 0
+            self.weights[c] = 0.0
+
+    def save(self, filename):
+        """ Saves all layers to a compressed ``.npz`` file. Layers are
+        stored as ``layer_<condition>``. """
+        data = dict(('layer_%s' % (c,), grid)
+                    for c, grid in self.layers.items())
+        savez_compressed(filename, dispsize=asarray(self.dispsize),
+                         binSize=self.binSize,
+                         sigma=-1 if self.sigma is None else self.sigma,
+                         **data)
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Feedback overlay on the Eyelink host-pc's display.
+
+Describe what the host display should show (fixation window, AOIs, status
+text) as a scene of named elements, then call ``flush()`` once per frame or
+trial. ``flush()`` compares the scene with what was sent last and only sends
+the difference:
+
+* unchanged scene: nothing is sent,
+* new elements only: just their drawing commands,
+* changed or removed elements: the host screen can't erase single elements,
+  so it is cleared and the whole scene is redrawn.
+
+Commands are queued and at most ``maxCommands`` (default 8) are sent per
+``flush()``, so even a full redraw never stalls the trial loop for long:
+a fixation window alone takes 17 commands, i.e. three flushes. Status messages
+(``record_status_message``, see ``notify()``) are only sent if they changed,
+and at most every ``statusInterval`` seconds.
+
+Typical use::
+
+    overlay = HostOverlay(el, dispsize)
+    for trial in trials:
+        overlay.fixation(targetLoc, FixLen, PixPerDeg=PixPerDeg)
+        overlay.aoi('left', (-400, 0, 200, 200))
+        overlay.status('trial %d of %d' % (trial, len(trials)))
+        overlay.flush()
+        while ...:
+            EyelinkGetGaze(...)
+            overlay.flush()  # sends leftover commands, if any
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from collections import OrderedDict, deque
+from math import sin, cos, pi, sqrt
+from time import time
+from EyelinkCoords import PsychopyToEyelink
+
+
+class HostOverlay(object):
+    """ Diffed, batched drawing on the host-pc's display.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    el : Eyelink object
+        ...as returned by, e.g., ``EyelinkStart()``
+    dispsize : tuple
+        two-item tuple width & height in px (as passed to ``EyelinkStart``)
+    statusInterval : float
+        minimum time in s between two status messages
+    maxCommands : int or None
+        maximum number of drawing commands sent per ``flush()``.
+        None sends all queued commands at once, e.g. between trials.
+    circleSegments : int
+        number of line segments used to draw the fixation circle
+    clock : function
+        returns the current time in s
+
+    Attributes
+    ----------
+    scene : OrderedDict
+        name -> tuple of host commands; drawn in this order
+    nSent : int
+        number of commands sent so far (including status messages)
+    """
+
+    def __init__(self, el, dispsize, statusInterval=0.5, maxCommands=8,
+                 circleSegments=16, clock=time):
+        self.el = el
+        self.dispsize = dispsize
+        self.statusInterval = statusInterval
+        self.maxCommands = maxCommands
+        self.clock = clock
+        self.scene = OrderedDict()
+        self.nSent = 0
+        # unit circle, computed once
+        t = [2 * pi * i / circleSegments for i in range(circleSegments + 1)]
+        self._circle = [(cos(a), sin(a)) for a in t]
+        # state of the host display once all pending commands are sent;
+        # None means unknown (e.g. cleared by a calibration)
+        self._target = None
+        self._pending = deque()
+        self._status = None
+        self._statusSent = None
+        self._statusTime = None
+
+    def _pix(self, x, y):
+        x, y = PsychopyToEyelink(x, y, self.dispsize)
+        return int(round(x)), int(round(y))
+
+    # --- scene description -------------------------------------------------
+    def set(self, name, commands):
+        """ Sets an element to a list of raw host commands. """
+        self.scene[name] = tuple(commands)
+
+    def remove(self, name):
+        """ Removes an element (no error if it doesn't exist). """
+        self.scene.pop(name, None)
+
+    def clear(self):
+        """ Removes all elements. """
+        self.scene.clear()
+
+    def _angleRadius(self, targetLoc, FixLen, VisAngle, c, s):
+        # distance in px from targetLoc in direction (c, s) at which the
+        # visual angle to targetLoc is FixLen. Starts from the point FixLen
+        # degrees away per axis (VisAngle.deg2pix) and bisects along the ray
+        cx, cy = targetLoc
+        x = VisAngle.deg2pix(VisAngle.pix2deg(cx, 0) + FixLen * c, 0)
+        y = VisAngle.deg2pix(VisAngle.pix2deg(cy, 1) + FixLen * s, 1)
+        lo = 0.0
+        hi = max(sqrt((x - cx) ** 2 + (y - cy) ** 2), 1.0)
+        while VisAngle.distance(cx + hi * c, cy + hi * s, targetLoc) < FixLen:
+            lo, hi = hi, 2 * hi
+        while hi - lo > 0.01:
+            r = (lo + hi) / 2
+            if VisAngle.distance(cx + r * c, cy + r * s, targetLoc) < FixLen:
+                lo = r
+            else:
+                hi = r
+        return (lo + hi) / 2
+
+    def fixation(self, targetLoc, FixLen, PixPerDeg=None, color=2,
+                 name='fixation', VisAngle=None):
+        """ Fixation window as used by ``EyelinkGetGaze``: a cross at
+        ``targetLoc`` and a circle with radius ``FixLen`` (degree if
+        ``PixPerDeg`` or ``VisAngle`` is given, else px). Coordinates in
+        psychopy pixels. With ``VisAngle`` (takes precedence), every point
+        of the circle is exactly ``FixLen`` degree away from the target, so
+        off-center windows are drawn distorted, as they are enforced. """
+        cx, cy = targetLoc
+        if VisAngle is not None:
+            points = []
+            for c, s in self._circle:
+                r = self._angleRadius(targetLoc, FixLen, VisAngle, c, s)
+                points.append(self._pix(cx + r * c, cy + r * s))
+        else:
+            r = FixLen * PixPerDeg if PixPerDeg is not None else FixLen
+            points = [self._pix(cx + r * c, cy + r * s)
+                      for c, s in self._circle]
+        commands = ['draw_cross %d %d %d' % (self._pix(cx, cy) + (color,))]
+        for (x1, y1), (x2, y2) in zip(points[:-1], points[1:]):
+            commands.append('draw_line %d %d %d %d %d'
+                            % (x1, y1, x2, y2, color))
+        self.set(name, commands)
+
+    def aoi(self, name, rect, color=3, label=None):
+        """ Area of interest as a box. ``rect`` is (x, y, width, height) in
+        psychopy pixels with (x, y) being the center, like psychopy's
+        ``Rect``. ``label`` is written into the top-left corner. """
+        x, y, w, h = rect
+        left, top = self._pix(x - w / 2.0, y + h / 2.0)
+        right, bottom = self._pix(x + w / 2.0, y - h / 2.0)
+        commands = ['draw_box %d %d %d %d %d'
+                    % (left, top, right, bottom, color)]
+        if label is not None:
+            commands.append('draw_text %d %d %d "%s"'
+                            % (left + 4, top + 12, color, label))
+        self.set(name, commands)
+
+    def status(self, message):
+        """ Sets the status text (``record_status_message``). Sent by
+        ``flush()``, rate-limited. """
+        self._status = message
+
+    def invalidate(self):
+        """ Forget what is on the host display, e.g. after a calibration
+        cleared it. The next ``flush()`` redraws everything. """
+        self._target = None
+        self._pending.clear()
+        self._statusSent = None
+
+    # --- sending -------------------------------------------------------------
+    def _diff(self):
+        target = self._target
+        if target is not None:
+            if len(target) <= len(self.scene) and all(
+                    self.scene.get(name) == commands
+                    for name, commands in target.items()):
+                # nothing changed or removed: only draw what's new
+                for name, commands in self.scene.items():
+                    if name not in target:
+                        self._pending.extend(commands)
+                self._target = OrderedDict(self.scene)
+                return
+        # (partly) unknown display or something changed/removed: redraw
+        self._pending.clear()
+        self._pending.append('clear_screen 0')
+        for commands in self.scene.values():
+            self._pending.extend(commands)
+        self._target = OrderedDict(self.scene)
+
+    def flush(self):
+        """ Sends the changes of the scene since the last call and the
+        status message, if due. Returns the number of commands sent. """
+        if self._target != self.scene:
+            self._diff()
+        n = 0
+        pending = self._pending
+        while pending and (self.maxCommands is None or
+                           n < self.maxCommands):
+            self.el.sendCommand(pending.popleft())
+            n += 1
+
+        if self._status is not None and self._status != self._statusSent:
+            now = self.clock()
+            if (self._statusTime is None or
+                    now - self._statusTime >= self.statusInterval):
+                self.el.sendCommand("record_status_message '%s'"
+                                    % self._status)
+                self._statusSent = self._status
+                self._statusTime = now
+                n += 1
+        self.nSent += n
+        return n
@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+"""
+Online pupil baselines and responses, e.g. for adaptive paradigms or to gate
+trials on arousal.
+
+``OnlinePupil`` is fed with pupil sizes from ``EyelinkGetGaze`` (or any other
+source of samples) and with the trial markers sent through
+``EyelinkSendTabMsg``. All buffers are allocated once at construction and
+nothing grows during the session. Samples are processed in amortized
+constant time: the first valid sample after a blink fills the whole gap
+(one vectorized write of the gap's length), but every sample is
+interpolated at most once.
+
+A typical trial loop looks like this::
+
+    pupil = OnlinePupil(maxTrials=400, maxSamples=3000, baselineSamples=200)
+    EyelinkSendTabMsg(['trialOnset', trial], el)
+    pupil.message(['trialOnset', trial])
+    while ...:
+        pupil.add_gaze(EyelinkGetGaze(targetLoc, FixLen, dispsize, el))
+        if pupil.response > threshold:
+            ...
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from math import sqrt
+from numpy import zeros, full, arange, multiply, nan
+
+
+class OnlinePupil(object):
+    """ Incremental per-trial pupil baselines, traces and statistics.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    maxTrials : int
+        Number of trials to reserve memory for. Further trials are counted
+        in ``nDroppedTrials``, their samples are ignored.
+    maxSamples : int
+        Maximum number of samples per trial. Further samples of a trial are
+        counted in ``nDropped`` but otherwise ignored.
+    baselineSamples : int
+        The first ``baselineSamples`` samples after the trial marker form the
+        baseline. Responses are only computed afterwards.
+    window : int
+        Length (in samples) of the sliding window for ``windowMean`` and
+        ``windowStd``.
+    blinkPad : int
+        Number of valid samples after a blink that are still treated as
+        missing, because the pupil signal needs some time to recover.
+    mode : string
+        'subtractive' (pupil - baseline) or 'divisive' (pupil / baseline).
+    trialMarker : string
+        Event-definition (first item of the ``EyelinkSendTabMsg`` list) that
+        starts a new trial.
+    trialEndMarker : string, optional
+        Event-definition that ends the current trial. If None, a trial ends
+        when the next one starts or when ``end_trial()`` is called.
+
+    Attributes
+    ----------
+    traces : ndarray, maxTrials x maxSamples
+        blink-interpolated pupil trace of each trial
+    nSamples : ndarray
+        number of samples stored for each trial
+    baselines : ndarray
+        baseline of each trial
+    peakResponses, meanResponses : ndarray
+        maximum and mean baseline-corrected response after the baseline
+        period of each trial
+    nDropped : int
+        number of samples ignored because a trial exceeded ``maxSamples``
+    nDroppedTrials : int
+        number of trials ignored because ``maxTrials`` was exceeded
+    """
+
+    def __init__(self, maxTrials, maxSamples, baselineSamples=200,
+                 window=100, blinkPad=50, mode='subtractive',
+                 trialMarker='trialOnset', trialEndMarker=None):
+        if mode not in ('subtractive', 'divisive'):
+            raise ValueError("mode must be 'subtractive' or 'divisive'")
+        if baselineSamples >= maxSamples:
+            raise ValueError('baselineSamples must be smaller than maxSamples')
+        self.maxTrials = maxTrials
+        self.maxSamples = maxSamples
+        self.baselineSamples = baselineSamples
+        self.window = window
+        self.blinkPad = blinkPad
+        self.divisive = mode == 'divisive'
+        self.trialMarker = trialMarker
+        self.trialEndMarker = trialEndMarker
+
+        # per-trial results
+        self.traces = full((maxTrials, maxSamples), nan)
+        self.nSamples = zeros(maxTrials, dtype=int)
+        self.baselines = full(maxTrials, nan)
+        self.peakResponses = full(maxTrials, nan)
+        self.meanResponses = full(maxTrials, nan)
+        # ring buffer for the sliding window
+        self._ringVal = zeros(window)
+        self._ringValid = zeros(window, dtype=bool)
+        # ramp used to interpolate blinks without temporary arrays
+        self._ramp = arange(1, maxSamples + 1, dtype=float)
+
+        self.trial = -1
+        self.nDropped = 0
+        self.nDroppedTrials = 0
+        self._inTrial = False
+        self._reset_trial_state()
+
+    def _reset_trial_state(self):
+        self.n = 0
+        self.response = nan
+        self._trace = None
+        self._gapStart = -1
+        self._lastValid = nan
+        self._recover = 0
+        self._baseSum = 0.0
+        self._baseN = 0
+        self._respSum = 0.0
+        self._respN = 0
+        self._peak = nan
+        self._ringPos = 0
+        self._winSum = 0.0
+        self._winSumSq = 0.0
+        self._winN = 0
+        self._ringValid[:] = False
+
+    def start_trial(self):
+        """ Close the running trial (if any) and start the next one. Beyond
+        ``maxTrials`` the trial is only counted in ``nDroppedTrials``, as
+        this usually runs inside ``send_msg`` in the middle of a session. """
+        if self._inTrial:
+            self.end_trial()
+        if self.trial + 1 >= self.maxTrials:
+            self.nDroppedTrials += 1
+            self._reset_trial_state()
+            return
+        self.trial += 1
+        self._reset_trial_state()
+        self._trace = self.traces[self.trial]
+        self._inTrial = True
+
+    def end_trial(self):
+        """ Close the running trial and store its summary values. """
+        if not self._inTrial:
+            return
+        # a blink that lasts until the end of the trial can't be
+        # interpolated, so hold the last valid value
+        if self._gapStart >= 0:
+            self._trace[self._gapStart:self.n] = self._lastValid
+            self._gapStart = -1
+        k = self.trial
+        self.nSamples[k] = self.n
+        self.baselines[k] = self.baseline
+        self.peakResponses[k] = self._peak
+        if self._respN:
+            self.meanResponses[k] = self._respSum / self._respN
+        self._inTrial = False
+
+    def message(self, infolist):
+        """ Inspect a message as passed to ``EyelinkSendTabMsg`` and start or
+        end trials accordingly. """
+        if not isinstance(infolist, list):
+            infolist = [infolist]
+        # EyelinkSendTabMsg prepends '>' to the list it is given
+        if len(infolist) > 1 and infolist[0] == '>':
+            tag = infolist[1]
+        else:
+            tag = infolist[0]
+        if tag == self.trialMarker:
+            self.start_trial()
+        elif self.trialEndMarker is not None and tag == self.trialEndMarker:
+            self.end_trial()
+
+    def add_gaze(self, GazeInfo):
+        """ Add the pupil size of an ``EyelinkGetGaze`` result. ``None``
+        (i.e., no new sample available) is ignored. """
+        if GazeInfo is not None:
+            self.add_sample(GazeInfo['pupilSize'])
+
+    def add_sample(self, pupil):
+        """ Add one pupil sample. ``None`` or values <= 0 count as missing
+        (blink or lost pupil). Samples outside of trials are ignored.
+        Amortized O(1); the first valid sample after a gap is O(gap). """
+        if not self._inTrial:
+            return
+        i = self.n
+        if i >= self.maxSamples:
+            self.nDropped += 1
+            return
+        self.n = i + 1
+        trace = self._trace
+
+        valid = pupil is not None and pupil > 0
+        if not valid:
+            self._recover = self.blinkPad
+        elif self._recover > 0:
+            self._recover -= 1
+            valid = False
+
+        if not valid:
+            if self._gapStart < 0:
+                self._gapStart = i
+            self._push_window(0.0, False)
+            return
+
+        pupil = float(pupil)
+        trace[i] = pupil
+        if self._gapStart >= 0:
+            self._interpolate_gap(i, pupil)
+        self._lastValid = pupil
+        self._push_window(pupil, True)
+
+        if i < self.baselineSamples:
+            self._baseSum += pupil
+            self._baseN += 1
+        elif self._baseN:
+            base = self._baseSum / self._baseN
+            if self.divisive:
+                resp = pupil / base
+            else:
+                resp = pupil - base
+            self.response = resp
+            self._respSum += resp
+            self._respN += 1
+            if not resp <= self._peak:  # also true while _peak is nan
+                self._peak = resp
+
+    def _interpolate_gap(self, i, pupil):
+        # linear interpolation between the last valid sample before the gap
+        # and the current one, written in place into the trace. O(gap), but
+        # each missing sample is only written here once
+        g = self._gapStart
+        n = i - g
+        gap = self._trace[g:i]
+        if self._lastValid != self._lastValid:  # trial started with a gap
+            gap[:] = pupil
+        else:
+            step = (pupil - self._lastValid) / (n + 1)
+            multiply(self._ramp[:n], step, out=gap)
+            gap += self._lastValid
+        self._gapStart = -1
+
+    def _push_window(self, value, valid):
+        j = self._ringPos
+        if self._ringValid[j]:
+            old = self._ringVal[j]
+            self._winSum -= old
+            self._winSumSq -= old * old
+            self._winN -= 1
+        self._ringVal[j] = value
+        self._ringValid[j] = valid
+        if valid:
+            self._winSum += value
+            self._winSumSq += value * value
+            self._winN += 1
+        j += 1
+        self._ringPos = 0 if j == self.window else j
+
+    @property
+    def baseline(self):
+        """ (Running) baseline of the current trial, nan if not available """
+        if self._baseN:
+            return self._baseSum / self._baseN
+        return nan
+
+    @property
+    def windowMean(self):
+        """ Mean pupil size of the valid samples in the sliding window """
+        if self._winN:
+            return self._winSum / self._winN
+        return nan
+
+    @property
+    def windowStd(self):
+        """ Standard deviation of the valid samples in the sliding window """
+        if self._winN:
+            mean = self._winSum / self._winN
+            return sqrt(max(self._winSumSq / self._winN - mean * mean, 0.0))
+        return nan
+
+    @property
+    def validFraction(self):
+        """ Fraction of valid samples in the sliding window """
+        return float(self._winN) / self.window
+
+    def trial_trace(self, trial=None):
+        """ Blink-interpolated trace of a trial (default: the current one).
+        Returns a view, not a copy. Samples of a blink that is still going
+        on are nan. """
+        if trial is None:
+            trial = self.trial
+        if trial == self.trial and self._inTrial:
+            n = self.n
+        else:
+            n = self.nSamples[trial]
+        return self.traces[trial, :n]
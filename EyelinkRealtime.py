@@ -0,0 +1,287 @@
+# -*- coding: utf-8 -*-
+"""
+Optional real-time recording profile for Linux.
+
+``pylink.beginRealTimeMode`` only raises the priority of the process. During
+recording, the acquisition and render loop can still be preempted by other
+processes, migrated between CPUs, or stalled by Python's garbage collector.
+A ``RecordingProfile`` passed to ``EyelinkStart``/``EyelinkStop`` (as
+``rtProfile``) additionally
+
+* pins the calling thread (acquisition/render loop) to a set of CPUs,
+* switches it to ``SCHED_FIFO``, or at least lowers its nice value,
+* collects, freezes and disables the garbage collector (call ``collect()``
+  in inter-trial intervals, see below),
+* prefaults (and optionally locks) memory, e.g. the buffers of
+  ``OnlinePupil`` or ``GazeHeatmap``,
+
+and undoes all of it when recording stops. Every step that is not available
+(other OS, old Python) or not permitted (missing privileges) is skipped and
+listed in ``skipped``; nothing raises. On Python 2, only the garbage
+collector and memory steps are available.
+
+With the collector disabled, reference cycles created while recording are
+never freed, and memory grows over the session. Call ``collect()`` whenever
+a pause of a few ms doesn't matter, e.g. in every inter-trial interval.
+
+Real-time scheduling usually requires ``CAP_SYS_NICE`` or an ``rtprio`` entry
+in ``/etc/security/limits.conf``, locking memory a sufficient ``memlock``
+limit.
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import gc
+import os
+import ctypes
+import ctypes.util
+import threading
+
+PAGESIZE = 4096
+MCL_CURRENT = 1
+MCL_FUTURE = 2
+
+# the garbage collector is process-global: profiles that are active at the
+# same time (e.g. concurrent sessions) share it. The first one saves its
+# state, the last one to exit restores it
+_gcLock = threading.Lock()
+_gcProfiles = set()
+_gcWasEnabled = True
+
+
+def pin_thread(cpus):
+    """ Pins the calling thread to ``cpus`` (e.g. ``[2, 3]``). On Linux,
+    affinity is per thread, so call this at the start of every thread that
+    should be pinned (e.g. your own acquisition thread).
+
+    Returns the previous affinity, or None if not supported. """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, cpus)
+    return previous
+
+
+def prefault(buffers):
+    """ Touches every memory page of the given numpy arrays, so that no page
+    fault happens when they are first written during recording. The content
+    of the arrays is not changed. """
+    from numpy import uint8
+    for buf in buffers:
+        if not buf.flags.c_contiguous or not buf.flags.writeable:
+            continue
+        pages = buf.reshape(-1).view(uint8)[::PAGESIZE]
+        # write the same values back: a write (not just a read) is needed
+        # to get a private page instead of the shared zero page
+        pages[...] = pages.copy()
+
+
+class RecordingProfile(object):
+    """ Scheduling, CPU and memory settings for the duration of a recording.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    cpus : list of int, optional
+        CPUs to pin the calling thread to, e.g. ``[3]``. Ideally CPUs that
+        are isolated from the rest of the system (``isolcpus``).
+    rtPriority : int, optional
+        ``SCHED_FIFO`` priority (1-99) for the calling thread. If not
+        permitted, falls back to ``nice``. Only use this if the loop blocks
+        regularly (e.g. waits for the flip): a ``SCHED_FIFO`` thread that
+        busy-polls is stopped by the kernel's real-time throttling for
+        50 ms every second (``/proc/sys/kernel/sched_rt_runtime_us``),
+        which is far worse than the jitter it should prevent.
+    nice : int, optional
+        nice value used if ``SCHED_FIFO`` is not used or not permitted.
+    gcMode : string or None
+        'freeze': collect, then move all objects to the permanent generation
+        and disable the collector (Python 3.7+, else like 'disable');
+        'disable': collect, then disable the collector; None: don't touch it.
+        The collector is shared by all active profiles and only restored
+        when the last of them exits.
+    buffers : list of ndarray
+        arrays to prefault, see ``prefault``
+    lockMemory : boolean
+        lock all current and future memory of the process into RAM
+        (``mlockall``), so that it can't be swapped out
+
+    Attributes
+    ----------
+    applied : list
+        steps that were applied by ``enter()``
+    skipped : list
+        steps that were skipped, with the reason
+
+    Examples
+    --------
+    >>> profile = RecordingProfile(cpus=[3], rtPriority=50,
+    ...                            buffers=[pupil.traces])
+    >>> el = EyelinkStart(dispsize, 'sub01', win, rtProfile=profile)
+    >>> for trial in trials:
+    ...     runTrial(trial)
+    ...     profile.collect()  # inter-trial interval
+    >>> EyelinkStop('sub01', el=el, rtProfile=profile)
+    """
+
+    def __init__(self, cpus=None, rtPriority=None, nice=-10, gcMode='freeze',
+                 buffers=(), lockMemory=False):
+        self.cpus = cpus
+        self.rtPriority = rtPriority
+        self.nice = nice
+        self.gcMode = gcMode
+        self.buffers = list(buffers)
+        self.lockMemory = lockMemory
+        self.applied = []
+        self.skipped = []
+        self.active = False
+        self._previous = {}
+
+    def _skip(self, step, reason):
+        self.skipped.append('%s: %s' % (step, reason))
+
+    def enter(self):
+        """ Applies the profile to the calling thread and the process. """
+        global _gcWasEnabled
+        if self.active:
+            return
+        self.applied = []
+        self.skipped = []
+        self._previous = {}
+
+        if self.cpus is not None:
+            try:
+                previous = pin_thread(self.cpus)
+                if previous is None:
+                    self._skip('affinity', 'not supported on this system')
+                else:
+                    self._previous['affinity'] = previous
+                    self.applied.append('affinity')
+            except OSError as e:
+                self._skip('affinity', e)
+
+        fifo = False
+        if self.rtPriority is not None:
+            if hasattr(os, 'sched_setscheduler'):
+                try:
+                    policy = os.sched_getscheduler(0)
+                    param = os.sched_getparam(0)
+                    os.sched_setscheduler(0, os.SCHED_FIFO,
+                                          os.sched_param(self.rtPriority))
+                    self._previous['scheduler'] = (policy, param)
+                    self.applied.append('SCHED_FIFO')
+                    fifo = True
+                except OSError as e:
+                    self._skip('SCHED_FIFO', e)
+            else:
+                self._skip('SCHED_FIFO', 'not supported on this system')
+        if not fifo and self.nice is not None:
+            if hasattr(os, 'setpriority'):
+                try:
+                    previous = os.getpriority(os.PRIO_PROCESS, 0)
+                    os.setpriority(os.PRIO_PROCESS, 0, self.nice)
+                    self._previous['nice'] = previous
+                    self.applied.append('nice')
+                except OSError as e:
+                    self._skip('nice', e)
+            else:
+                self._skip('nice', 'not supported on this system')
+
+        if self.gcMode is not None:
+            with _gcLock:
+                if not _gcProfiles:
+                    _gcWasEnabled = gc.isenabled()
+                _gcProfiles.add(self)
+                gc.collect()
+                if self.gcMode == 'freeze' and hasattr(gc, 'freeze'):
+                    gc.freeze()
+                    self.applied.append('gc freeze')
+                gc.disable()
+            self._previous['gc'] = True
+            self.applied.append('gc disable')
+
+        if self.buffers:
+            prefault(self.buffers)
+            self.applied.append('prefault')
+
+        if self.lockMemory:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library('c'),
+                                   use_errno=True)
+                if libc.mlockall(MCL_CURRENT | MCL_FUTURE) != 0:
+                    raise OSError(ctypes.get_errno(),
+                                  os.strerror(ctypes.get_errno()))
+                self._previous['mlock'] = libc
+                self.applied.append('mlockall')
+            except (OSError, AttributeError) as e:
+                self._skip('mlockall', e)
+
+        self.active = True
+
+    def collect(self):
+        """ Full garbage collection while the profile is active, e.g. in the
+        inter-trial interval. Objects frozen by ``enter()`` are included and
+        the survivors frozen again; the collector stays disabled. Returns
+        the number of unreachable objects found (see ``gc.collect``). """
+        with _gcLock:
+            frozen = self.active and 'gc freeze' in self.applied
+            if frozen:
+                gc.unfreeze()
+            n = gc.collect()
+            if frozen:
+                gc.freeze()
+        return n
+
+    def exit(self):
+        """ Restores everything ``enter()`` changed. The garbage collector
+        is only restored when no other profile is active. """
+        if not self.active:
+            return
+        previous = self._previous
+        if 'mlock' in previous:
+            previous['mlock'].munlockall()
+        if 'gc' in previous:
+            with _gcLock:
+                _gcProfiles.discard(self)
+                if not _gcProfiles:
+                    if hasattr(gc, 'unfreeze'):
+                        gc.unfreeze()
+                    if _gcWasEnabled:
+                        gc.enable()
+        if 'scheduler' in previous:
+            policy, param = previous['scheduler']
+            os.sched_setscheduler(0, policy, param)
+        if 'nice' in previous:
+            try:
+                os.setpriority(os.PRIO_PROCESS, 0, previous['nice'])
+            except OSError:
+                pass  # going back to a higher nice value is always permitted
+        if 'affinity' in previous:
+            os.sched_setaffinity(0, previous['affinity'])
+        self._previous = {}
+        self.active = False
+
+    def __enter__(self):
+        self.enter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.exit()
+        return False
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+"""
+Offline re-scoring of the online fixation control done by ``EyelinkGetGaze``.
+
+``EyelinkGetGaze`` decides once per poll whether gaze left the allowed circle
+(``hsmvd``), but this decision is not stored anywhere. ``EyelinkRescoreFixation``
+applies exactly the same rules to complete arrays of recorded samples in one
+vectorized pass, so it can be reproduced afterwards why a trial was (or
+wasn't) aborted. Only depends on numpy, so it also runs on machines without
+pylink.
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from numpy import (asarray, sqrt, isnan, where, unique, bincount,
+                   flatnonzero, full)
+from EyelinkCoords import EyelinkToPsychopy
+
+# value of pylink.MISSING_DATA. Samples read with the EDF API use 1e8
+# instead; pass ``missingValue`` accordingly.
+MISSING_DATA = -32768
+
+
+def EyelinkRescoreFixation(gx, gy, pupil, targetLoc, FixLen, dispsize,
+                           PixPerDeg=None, IgnoreBlinks=False,
+                           blinkStart=None, trials=None,
+                           missingValue=MISSING_DATA, VisAngle=None):
+    """ Vectorized, offline version of the ``hsmvd`` decision of
+    ``EyelinkGetGaze``.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    gx, gy : array
+        gaze coordinates of the tracked eye as recorded by the tracker, i.e.
+        in Eyelink coordinates ((0,0) is top-left). ``nan`` counts as
+        missing, too.
+    pupil : array
+        pupil size of every sample
+    targetLoc : tuple or array
+        (x, y) in psychopy coordinates, either one pair for all samples or
+        one pair per sample (shape n x 2)
+    FixLen : float or array
+        radius of the allowed circle (see ``EyelinkGetGaze``)
+    dispsize : tuple
+        two-item tuple width & height in px
+    PixPerDeg : float, optional
+        If provided, ``FixLen`` is assumed to be in degree.
+    IgnoreBlinks : boolean
+        see ``EyelinkGetGaze``
+    blinkStart : boolean array, optional
+        True where the event polled together with the sample was
+        ``pylink.STARTBLINK``
+    trials : array, optional
+        trial label of every sample. If given, per-trial verdicts are
+        returned as well.
+    missingValue : float
+        value that marks missing gaze data
+    VisAngle : EyelinkCoords.VisualAngle, optional
+        see ``EyelinkGetGaze``
+
+    Returns
+    -------
+    samples : dict
+        ``x``, ``y``, ``hsmvd`` and ``pupilSize`` per sample, exactly as
+        ``EyelinkGetGaze`` would have returned them, plus ``missing``,
+        ``blinked`` and ``dist`` (nan where gaze is missing).
+    trials : dict or None
+        ``trial`` (unique labels), ``aborted`` (any ``hsmvd`` in the trial),
+        ``nViolations`` and ``firstViolation`` (sample index, -1 if none)
+    """
+    gx = asarray(gx, dtype=float)
+    gy = asarray(gy, dtype=float)
+    pupil = asarray(pupil, dtype=float)
+    targetLoc = asarray(targetLoc, dtype=float)
+    tx = targetLoc[..., 0]
+    ty = targetLoc[..., 1]
+
+    # online: `if pylink.MISSING_DATA in gaze`
+    missing = ((gx == missingValue) | (gy == missingValue) |
+               isnan(gx) | isnan(gy))
+    # online: definitely (STARTBLINK) or probably (pupil == 0) blinking
+    blinked = pupil == 0
+    if blinkStart is not None:
+        blinked = blinked | asarray(blinkStart, dtype=bool)
+    blinked &= missing
+
+    # Eyelink thinks (0,0) = topleft, PsyPy thinks it's center...
+    x, y = EyelinkToPsychopy(gx, gy, dispsize)
+    if VisAngle is not None:
+        dist = VisAngle.angle(x, y, tx, ty)
+    else:
+        dx = tx - x
+        dy = ty - y
+        dist = sqrt(dx ** 2 + dy ** 2)
+        if PixPerDeg is not None:
+            dist = dist / PixPerDeg
+    dist[missing] = float('nan')
+
+    hsmvd = where(missing, True, dist > FixLen)
+    # raw (unconverted) coordinates are passed through for missing data
+    x = where(missing, gx, x)
+    y = where(missing, gy, y)
+    if IgnoreBlinks:
+        hsmvd[blinked] = False
+        x = where(blinked, tx, x)
+        y = where(blinked, ty, y)
+
+    samples = {'x': x, 'y': y, 'hsmvd': hsmvd, 'pupilSize': pupil,
+               'missing': missing, 'blinked': blinked, 'dist': dist}
+    if trials is None:
+        return samples, None
+
+    labels, inverse = unique(asarray(trials), return_inverse=True)
+    nViolations = bincount(inverse, weights=hsmvd,
+                           minlength=len(labels)).astype(int)
+    firstViolation = full(len(labels), -1, dtype=int)
+    violations = flatnonzero(hsmvd)
+    # unique() returns the index of the first occurrence, and violations
+    # are in temporal order
+    violTrials, first = unique(inverse[violations], return_index=True)
+    firstViolation[violTrials] = violations[first]
+    trialInfo = {'trial': labels, 'aborted': nViolations > 0,
+                 'nViolations': nViolations,
+                 'firstViolation': firstViolation}
+    return samples, trialInfo
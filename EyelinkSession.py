@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""
+Object oriented wrapper around the functions in ``EyelinkWrapper``.
+
+All functions in ``EyelinkWrapper`` fall back on the single tracker returned
+by ``pylink.getEYELINK()``. A ``TrackerSession`` instead keeps its own tracker
+object, EDF filename, display size and some bookkeeping, and passes the
+tracker explicitly to every call. That way several rigs (or several dummy
+trackers) can be driven from one script. See ``EyelinkSessionAsync`` for
+non-blocking counterparts of all methods.
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+from EyelinkWrapper import (EyelinkStart, EyelinkStop, EyelinkCalibrate,
+                            EyelinkDriftCheck, EyelinkGetGaze,
+                            EyelinkGetGazeFast, GazeInfo, EyelinkSendTabMsg,
+                            notify)
+
+
+class TrackerSession(object):
+    """ One eyetracker, its EDF file and its per-session state.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    dispsize : tuple
+        two-item tuple width & height in px
+    Name : string
+        filename for the edf (see ``EyelinkStart``)
+    win : window object
+        psychopy window used for calibration. Only needed for ``start()``.
+        ``start()``, ``calibrate()`` and ``drift_check()`` must be called
+        from the thread that created it (see ``EyelinkSessionAsync``).
+    dummy : boolean
+        Run tracker in dummy mode?
+    address : string
+        IP address of the Eyelink host-pc of this rig.
+    el : Eyelink object, optional
+        An already connected tracker. If given, ``start()`` is not required
+        before polling gaze or sending messages.
+    rtProfile : EyelinkRealtime.RecordingProfile, optional
+        Entered by ``start()`` and left by ``stop()``. CPU affinity and
+        scheduling apply to the thread calling ``start()``.
+
+    Attributes
+    ----------
+    msgListeners : list
+        Objects with a ``message(infolist)`` method (e.g.
+        ``EyelinkPupil.OnlinePupil``) that see every message sent via
+        ``send_msg()``, so they can align themselves to trial markers.
+    overlay : EyelinkHostOverlay.HostOverlay or None
+        Host-pc overlay of this rig. Invalidated by ``calibrate()`` and
+        ``drift_check()``, which clear the host display.
+
+    Notes
+    -----
+    pylink's realtime mode and calibration graphics act on the whole process,
+    not on a single tracker. ``EyelinkWrapper`` therefore runs calibrations
+    and drift checks of concurrent sessions one after another, each with its
+    own window, and only leaves realtime mode and closes the graphics when
+    the last started session stops.
+    """
+
+    def __init__(self, dispsize, Name, win=None, dummy=False,
+                 address="100.1.1.1", el=None, rtProfile=None):
+        self.dispsize = dispsize
+        self.Name = Name
+        self.win = win
+        self.dummy = dummy
+        self.address = address
+        self.el = el
+        self.rtProfile = rtProfile
+        self.isRecording = False
+        self.nMessages = 0
+        self.lastGaze = None
+        self.gazeInfo = GazeInfo()
+        self.msgListeners = []
+        self.overlay = None
+
+    def start(self, **kwargs):
+        """ Connect, calibrate and start recording (see ``EyelinkStart``).
+        Additional keyword arguments are passed on to ``EyelinkStart``. """
+        self.el = EyelinkStart(self.dispsize, self.Name, self.win,
+                               dummy=self.dummy, address=self.address,
+                               rtProfile=self.rtProfile, **kwargs)
+        self.isRecording = True
+        return self.el
+
+    def stop(self):
+        """ Stop recording and pull the EDF file (see ``EyelinkStop``). """
+        EyelinkStop(self.Name, el=self.el, rtProfile=self.rtProfile)
+        self.isRecording = False
+
+    def calibrate(self):
+        """ Interrupt recording for a recalibration. """
+        self.gazeInfo.eye = None
+        if self.overlay is not None:
+            self.overlay.invalidate()
+        return EyelinkCalibrate(self.dispsize, el=self.el)
+
+    def drift_check(self):
+        """ Interrupt recording for a drift check. """
+        self.gazeInfo.eye = None
+        if self.overlay is not None:
+            self.overlay.invalidate()
+        return EyelinkDriftCheck(self.dispsize, el=self.el)
+
+    def get_gaze(self, targetLoc, FixLen, **kwargs):
+        """ Poll gaze of this session's tracker (see ``EyelinkGetGaze``).
+        The last valid result is kept in ``lastGaze``. """
+        gaze = EyelinkGetGaze(targetLoc, FixLen, self.dispsize, el=self.el,
+                              **kwargs)
+        if gaze is not None:
+            self.lastGaze = gaze
+        return gaze
+
+    def poll_gaze(self, targetLoc, FixLen, **kwargs):
+        """ Like ``get_gaze``, but via ``EyelinkGetGazeFast``: always fills
+        and returns this session's ``gazeInfo`` (``OversamplingBehavior`` if
+        there's no new sample). ``lastGaze`` is not updated. """
+        return EyelinkGetGazeFast(targetLoc, FixLen, self.dispsize,
+                                  el=self.el, out=self.gazeInfo, **kwargs)
+
+    def send_msg(self, infolist):
+        """ Send a tab-delimited message to this session's EDF. """
+        EyelinkSendTabMsg(infolist, el=self.el)
+        self.nMessages += 1
+        for listener in self.msgListeners:
+            listener.message(infolist)
+
+    def notify(self, message):
+        """ Show a message on this session's host-pc. """
+        notify(message, el=self.el)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.isRecording:
+            self.stop()
+        return False
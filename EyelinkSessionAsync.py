@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+"""
+``asyncio`` counterparts of ``EyelinkSession.TrackerSession``.
+
+pylink blocks in many places (``msecDelay``, ``doTrackerSetup``,
+``receiveDataFile``). ``AsyncTrackerSession`` runs these calls in an executor,
+so a single orchestrating process can supervise several rigs at once, e.g.
+pull the EDF of one session while the next one is being set up.
+
+Every session gets its own single-threaded executor by default. Calls to one
+tracker are therefore executed one after another and always from the same
+thread, while different sessions run concurrently.
+
+``start()``, ``calibrate()`` and ``drift_check()`` draw into the session's
+psychopy window. An OpenGL (pyglet) window can only be used from the thread
+that created it; anything else fails and can crash the process on macOS.
+Either create the window on the session's thread (``await s.run(
+visual.Window, ...)``), or create it in the thread running the event loop
+and pass ``setupInLoop=True``.
+
+Requires Python 3.7+.
+
+**Version**:
+    October 2026
+**copyright** :
+  Copyright (C) 2016 Wanja Mössing
+
+  This program is free software: you can redistribute it and/or modify
+  it under the terms of the GNU General Public License as published by
+  the Free Software Foundation, either version 3 of the License, or
+  (at your option) any later version.
+
+  This program is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+  GNU General Public License for more details.
+
+  You should have received a copy of the GNU General Public License
+  along with this program. If not, see <http://www.gnu.org/licenses/>.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+class AsyncTrackerSession(object):
+    """ Non-blocking wrapper around a ``TrackerSession``.
+
+    *October 2026*
+
+    Parameters
+    ----------
+    session : TrackerSession
+        The session to drive. Any object with the same methods works, e.g.
+        a simulated rig.
+    executor : concurrent.futures.Executor, optional
+        Executor for the blocking calls. Defaults to a private
+        single-threaded executor that is shut down by ``close()``.
+    setupInLoop : boolean
+        Run ``start()``, ``calibrate()`` and ``drift_check()`` directly in
+        the event loop's thread, i.e. the thread that created the window.
+        They block the loop while they run. Calls of other sessions that
+        already run in their executors (e.g. EDF transfers) go on.
+
+    Examples
+    --------
+    >>> async def run(session):
+    ...     async with AsyncTrackerSession(session) as s:
+    ...         session.win = await s.run(visual.Window, fullscr=True)
+    ...         await s.start()
+    ...         await s.send_msg(['trialOnset', 1])
+    ...         await s.stop()
+    >>> async def main(sessions):
+    ...     await asyncio.gather(*[run(s) for s in sessions])
+    >>> asyncio.run(main(sessions))
+    """
+
+    def __init__(self, session, executor=None, setupInLoop=False):
+        self.session = session
+        self.setupInLoop = setupInLoop
+        self._ownsExecutor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=1)
+        self._executor = executor
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor,
+                                          partial(func, *args, **kwargs))
+
+    async def _setup(self, func, *args, **kwargs):
+        # calls that draw into the window
+        if self.setupInLoop:
+            return func(*args, **kwargs)
+        return await self._run(func, *args, **kwargs)
+
+    async def run(self, func, *args, **kwargs):
+        """ Runs any blocking call on this session's executor, e.g. to
+        create its window there. """
+        return await self._run(func, *args, **kwargs)
+
+    async def start(self, **kwargs):
+        """ See ``TrackerSession.start``. """
+        return await self._setup(self.session.start, **kwargs)
+
+    async def stop(self):
+        """ See ``TrackerSession.stop``. """
+        return await self._run(self.session.stop)
+
+    async def calibrate(self):
+        """ See ``TrackerSession.calibrate``. """
+        return await self._setup(self.session.calibrate)
+
+    async def drift_check(self):
+        """ See ``TrackerSession.drift_check``. """
+        return await self._setup(self.session.drift_check)
+
+    async def get_gaze(self, targetLoc, FixLen, **kwargs):
+        """ See ``TrackerSession.get_gaze``. """
+        return await self._run(self.session.get_gaze, targetLoc, FixLen,
+                               **kwargs)
+
+    async def poll_gaze(self, targetLoc, FixLen, **kwargs):
+        """ See ``TrackerSession.poll_gaze``. """
+        return await self._run(self.session.poll_gaze, targetLoc, FixLen,
+                               **kwargs)
+
+    async def send_msg(self, infolist):
+        """ See ``TrackerSession.send_msg``. """
+        return await self._run(self.session.send_msg, infolist)
+
+    async def notify(self, message):
+        """ See ``TrackerSession.notify``. """
+        return await self._run(self.session.notify, message)
+
+    def close(self):
+        """ Shut down the private executor (if any). """
+        if self._ownsExecutor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        if self.session.isRecording:
+            await self.stop()
+        self.close()
+        return False
@@ -31,12 +31,42 @@ absolutely unrelated. So ``pip`` or ``conda install`` won't work!
 
 # import dependencies to global
 import pylink
+import threading
 from os import path, getcwd, mkdir
+from math import sqrt
 from numpy import sqrt as np_sqrt, sum as np_sum, array as np_array
 from EyeLinkCoreGraphicsPsychoPy import EyeLinkCoreGraphicsPsychoPy
+from EyelinkCoords import EyelinkToPsychopy
 # SR-Research's EyeLinkCoreGraphicsPsychoPy can be retrieved here:
 # https://www.sr-support.com/forum/eyelink/programming/5548-a-psychopy-implementation-of-the-eyelink-coregraphics
 
+# pylink's calibration graphics and realtime mode are global to the process,
+# but several trackers may be started (see EyelinkSession). Every started
+# tracker is registered with its graphics (_graphics) and, while recording,
+# in _realtime. endRealTimeMode() and closeGraphics() only happen when the
+# last tracker leaves _realtime and _graphics, respectively. _registryLock
+# guards this bookkeeping and is only held briefly. Calibrations and drift
+# checks run one at a time with their own graphics, under _calibrationLock,
+# so they don't hold up starting or stopping other trackers. If both are
+# needed, _calibrationLock is taken first.
+_registryLock = threading.Lock()
+_calibrationLock = threading.Lock()
+_graphics = {}
+_realtime = set()
+_currentGraphics = None
+
+
+def _useGraphics(el):
+    """ Makes the graphics of ``el`` pylink's current ones, if another
+    tracker opened its own in the meantime. Call with ``_calibrationLock``
+    held. """
+    global _currentGraphics
+    with _registryLock:
+        genv = _graphics.get(el)
+    if genv is not None and genv is not _currentGraphics:
+        pylink.openGraphicsEx(genv)
+        _currentGraphics = genv
+
 
 def notify(message='( ^_^)/ XX-XX ＼(^_^ )', el=pylink.getEYELINK()):
     """ Prints a message on Eyelink host-pc's interface
@@ -77,7 +107,7 @@ def AvoidWrongTriggers():
     """
     from os import system as sys
     from platform import system as sys_name
-    print 'Pinging Eyelink to check if connected and powered...'
+    print('Pinging Eyelink to check if connected and powered...')
 
     if sys_name() == 'Windows':
         r = sys('ping -n 1 100.1.1.1')
@@ -116,7 +146,11 @@ def EyelinkCalibrate(targetloc=(1920, 1080),
     # stop the recording
     el.stopRecording()
     # do the calibration
-    el.doTrackerSetup(targetloc[0], targetloc[1])
+    with _calibrationLock:
+        _useGraphics(el)
+        el.doTrackerSetup(targetloc[0], targetloc[1])
+    # the tracked eye may have changed
+    _gazeInfo.eye = None
     # clear tracker display and draw box at center
     el.sendCommand("clear_screen 0")
     el.sendCommand("set_idle_mode")
@@ -147,7 +181,10 @@ def EyelinkDriftCheck(targetloc=(1920, 1080),
         pylink.msecDelay(100)
         # stop the recording
         el.stopRecording()
-        res = el.doDriftCorrect(targetloc[0], targetloc[1], 1, 1)
+        with _calibrationLock:
+            _useGraphics(el)
+            res = el.doDriftCorrect(targetloc[0], targetloc[1], 1, 1)
+        _gazeInfo.eye = None
         # clear tracker display and draw box at center
         el.sendCommand("clear_screen 0")
         el.sendCommand("set_idle_mode")
@@ -160,7 +197,8 @@ def EyelinkDriftCheck(targetloc=(1920, 1080),
 
 
 def EyelinkStart(dispsize, Name, win, bits=32, dummy=False,
-                 colors=((0, 0, 0), (192, 192, 192))):
+                 colors=((0, 0, 0), (192, 192, 192)), address="100.1.1.1",
+                 rtProfile=None):
     """ Performs startup routines for the EyeLink 1000 Plus eyetracker.
 
     **Author** : Wanja Mössing, WWU Münster | moessing@wwu.de \n
@@ -182,6 +220,12 @@ def EyelinkStart(dispsize, Name, win, bits=32, dummy=False,
         Run tracker in dummy mode?
     colors  : Tuple, Optional.
         Tuple with two RGB triplets
+    address : string, Optional.
+        IP address of the Eyelink host-pc. Only needs to be changed if you
+        run more than one rig, e.g. via ``EyelinkSession.TrackerSession``.
+    rtProfile : EyelinkRealtime.RecordingProfile, Optional.
+        Applied right after entering realtime mode, i.e. for the duration
+        of the recording. Pass the same object to ``EyelinkStop()``.
 
     Returns
     -------
@@ -207,7 +251,7 @@ def EyelinkStart(dispsize, Name, win, bits=32, dummy=False,
     if dummy:
         el = pylink.EyeLink(None)
     else:
-        el = pylink.EyeLink("100.1.1.1")
+        el = pylink.EyeLink(address)
     print('. ')
     # Open EDF file on host
     el.openDataFile(Name)
@@ -222,7 +266,9 @@ def EyelinkStart(dispsize, Name, win, bits=32, dummy=False,
     # this function calls the custom calibration routine
     # "EyeLinkCoreGraphicsPsychopy.py"
     genv = EyeLinkCoreGraphicsPsychoPy(el, win)
-    pylink.openGraphicsEx(genv)
+    # opened right before the calibration, see _useGraphics
+    with _registryLock:
+        _graphics[el] = genv
     print('. ')
     # set tracker offline to change configuration
     el.setOfflineMode()
@@ -279,13 +325,22 @@ def EyelinkStart(dispsize, Name, win, bits=32, dummy=False,
     # run initial calibration
     # 13-Pt Grid calibration
     el.sendCommand('calibration_type = HV13')
-    el.doTrackerSetup(dispsize[0], dispsize[1])
+    with _calibrationLock:
+        _useGraphics(el)
+        el.doTrackerSetup(dispsize[0], dispsize[1])
+    # the shared result object of EyelinkGetGazeFast may cache the eye of
+    # another tracker
+    _gazeInfo.eye = None
     # put tracker in idle mode and wait 50ms, then really start it.
     el.sendMessage('SETUP_FINISHED')
     el.setOfflineMode()
     pylink.msecDelay(500)
     # set to realtime mode
+    with _registryLock:
+        _realtime.add(el)
     pylink.beginRealTimeMode(200)
+    if rtProfile is not None:
+        rtProfile.enter()
     # start recording
     # note: sending everything over the link *potentially* causes buffer
     # overflow. However, with modern PCs and EL1000+ this shouldn't be a real
@@ -321,7 +376,7 @@ def EyelinkStart(dispsize, Name, win, bits=32, dummy=False,
     return el
 
 
-def EyelinkStop(Name, el=pylink.getEYELINK()):
+def EyelinkStop(Name, el=pylink.getEYELINK(), rtProfile=None):
     """ Performs stopping routines for the EyeLink 1000 Plus eyetracker.
 
     **Author** : Wanja Mössing, WWU Münster | moessing@wwu.de \n
@@ -335,12 +390,23 @@ def EyelinkStop(Name, el=pylink.getEYELINK()):
     el : Eyelink Object
         Eyelink object returned by EyelinkStart().
         By default this function tried to find it itself.
+    rtProfile : EyelinkRealtime.RecordingProfile, Optional.
+        The profile passed to ``EyelinkStart()``, to be undone.
+
+    Realtime mode and the calibration graphics are only closed if no other
+    tracker started with ``EyelinkStart()`` is still running.
     """
+    global _currentGraphics
     # Check filename
     if '.edf' not in Name.lower():
             Name += '.edf'
-    # stop realtime mode
-    pylink.endRealTimeMode()
+    # stop realtime mode, unless other trackers are still running
+    if rtProfile is not None:
+        rtProfile.exit()
+    with _registryLock:
+        _realtime.discard(el)
+        if not _realtime:
+            pylink.endRealTimeMode()
     # make sure all experimental procedures finished
     pylink.msecDelay(1000)
     # stop the recording
@@ -354,20 +420,26 @@ def EyelinkStop(Name, el=pylink.getEYELINK()):
     # transfer edf to display-computer
     try:
         print('Wait for EDF to be copied over LAN...')
-        if not path.exists('./EDF'):
+        try:
             mkdir('./EDF')
+        except OSError:
+            pass  # exists already, e.g. created by a concurrent session
         el.receiveDataFile(Name, './EDF/'+Name)
         print('Done. EDF has been copied to ./EDF folder.')
     except RuntimeError:
         print('Error while pulling EDF file. Try to find it on Eyelink host..')
     el.close()
-    pylink.closeGraphics()
+    with _registryLock:
+        _graphics.pop(el, None)
+        if not _graphics:
+            pylink.closeGraphics()
+            _currentGraphics = None
     return
 
 
 def EyelinkGetGaze(targetLoc, FixLen, dispsize, el=pylink.getEYELINK(),
                    isET=True, PixPerDeg=None, IgnoreBlinks=False,
-                   OversamplingBehavior=None):
+                   OversamplingBehavior=None, VisAngle=None):
     """ Online gaze position output and gaze control for Eyelink 1000+.
 
     **Author** : Wanja Mössing, WWU Münster | moessing@wwu.de \n
@@ -399,6 +471,10 @@ def EyelinkGetGaze(targetLoc, FixLen, dispsize, el=pylink.getEYELINK(),
         If True, missing gaze position is replaced by center coordinates.
     OversamplingBehavior: None
         Defines what is returned if nothing new is available.
+    VisAngle: EyelinkCoords.VisualAngle, optional
+        If provided, the exact visual angle between gaze and ``targetLoc`` is
+        used and ``FixLen`` is assumed to be in degree. More accurate than
+        ``PixPerDeg`` towards the edges of the screen, and takes precedence.
 
     Returns
     -------
@@ -442,7 +518,7 @@ def EyelinkGetGaze(targetLoc, FixLen, dispsize, el=pylink.getEYELINK(),
                 gaze = sample.getRightEye().getGaze()
                 pupil = sample.getRightEye().getPupilSize()
             elif el.eyeAvailable() is BINOCULAR:
-                print 'Binocular mode not yet implemented'
+                print('Binocular mode not yet implemented')
                 return None
             else:
                 raise Exception('Could not detect which eye has been tracked')
@@ -469,29 +545,21 @@ def EyelinkGetGaze(targetLoc, FixLen, dispsize, el=pylink.getEYELINK(),
                     hsmvd = True
             else:
                 # Eyelink thinks (0,0) = topleft, PsyPy thinks it's center...
-                xhalf = dispsize[0]/2
-                yhalf = dispsize[1]/2
-                x = gaze[0]
-                y = gaze[1]
-                if x >= xhalf:
-                    xout = x - xhalf
-                else:
-                    xout = (xhalf - x) * -1
-                if y >= yhalf:
-                    yout = (y - yhalf) * -1
+                gaze = EyelinkToPsychopy(gaze[0], gaze[1], dispsize)
+                if VisAngle is not None:
+                    # exact visual angle in degree
+                    dist = VisAngle.distance(gaze[0], gaze[1], targetLoc)
                 else:
-                    yout = yhalf - y
-                gaze = (xout, yout)
-                # transform location data to numpy arrays, so we can calculate
-                # euclidean distance
-                a = np_array(targetLoc)
-                b = np_array(gaze)
-                # get euclidean distance in px
-                dist = np_sqrt(np_sum((a-b)**2))
-                # check if we know how many px form one degree.
-                # If we do, convert to degree
-                if PixPerDeg is not None:
-                    dist = dist/PixPerDeg
+                    # transform location data to numpy arrays, so we can
+                    # calculate euclidean distance
+                    a = np_array(targetLoc)
+                    b = np_array(gaze)
+                    # get euclidean distance in px
+                    dist = np_sqrt(np_sum((a-b)**2))
+                    # check if we know how many px form one degree.
+                    # If we do, convert to degree
+                    if PixPerDeg is not None:
+                        dist = dist/PixPerDeg
                 # Now check whether gaze is in allowed frame
                 hsmvd = dist > FixLen
 
@@ -507,6 +575,152 @@ def EyelinkGetGaze(targetLoc, FixLen, dispsize, el=pylink.getEYELINK(),
                 'pupilSize': None}
 
 
+class GazeInfo(object):
+    """ Reusable result object of ``EyelinkGetGazeFast()``.
+
+    *October 2026*
+
+    Has the same fields as the dict returned by ``EyelinkGetGaze()`` (``x``,
+    ``y``, ``hsmvd``, ``pupilSize``) and can be read like that dict:
+    ``g['hsmvd']``, ``g.get('x')``, ``'x' in g``, ``keys()``, ``values()``,
+    ``items()``, iteration and ``len()``. It can't be modified dict-style.
+    ``eye`` caches the tracked eye; set it back to None if that might have
+    changed (e.g. after a recalibration). It is not one of the dict keys.
+    """
+    __slots__ = ('x', 'y', 'hsmvd', 'pupilSize', 'eye')
+    _keys = ('x', 'y', 'hsmvd', 'pupilSize')
+
+    def __init__(self):
+        self.x = None
+        self.y = None
+        self.hsmvd = False
+        self.pupilSize = None
+        self.eye = None
+
+    def __getitem__(self, key):
+        if key not in self._keys:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in self._keys else default
+
+    def keys(self):
+        return list(self._keys)
+
+    def values(self):
+        return [getattr(self, key) for key in self._keys]
+
+    def items(self):
+        return [(key, getattr(self, key)) for key in self._keys]
+
+    def asdict(self):
+        """ Copy of the fields as returned by ``EyelinkGetGaze()`` """
+        return {'x': self.x, 'y': self.y, 'hsmvd': self.hsmvd,
+                'pupilSize': self.pupilSize}
+
+
+# result object used by EyelinkGetGazeFast() if the caller doesn't pass one
+_gazeInfo = GazeInfo()
+
+
+def EyelinkGetGazeFast(targetLoc, FixLen, dispsize, el=pylink.getEYELINK(),
+                       isET=True, PixPerDeg=None, IgnoreBlinks=False,
+                       OversamplingBehavior=None, VisAngle=None, out=None):
+    """ Allocation-free variant of ``EyelinkGetGaze()``.
+
+    *October 2026*
+
+    Makes exactly the same decisions as ``EyelinkGetGaze()`` and takes the
+    same parameters, but is meant to be polled at the sampling rate: it
+    fills a reusable ``GazeInfo`` instead of creating a new dict, computes
+    the distance with plain float math instead of temporary numpy arrays,
+    asks the tracker which eye is recorded only once, and doesn't print.
+
+    Parameters
+    ----------
+    out : GazeInfo, optional
+        object to fill. If None, a module-level ``GazeInfo`` is used, i.e.
+        the result is overwritten by the next call. Its cached eye is reset
+        by ``EyelinkStart``, ``EyelinkCalibrate`` and ``EyelinkDriftCheck``.
+        Use one object per tracker if you poll several, and reset its
+        ``eye`` after a recalibration.
+
+    See ``EyelinkGetGaze()`` for all other parameters.
+
+    Returns
+    -------
+    GazeInfo: GazeInfo
+        ``out`` (or the module-level object). ``OversamplingBehavior`` if
+        no new sample is available, None in binocular mode.
+    """
+    if out is None:
+        out = _gazeInfo
+    if not isET:
+        out.x = targetLoc[0]
+        out.y = targetLoc[1]
+        out.hsmvd = False
+        out.pupilSize = None
+        return out
+
+    sample = el.getNewestSample()
+    event = el.getNextData()
+    if sample is None:
+        return OversamplingBehavior
+
+    eye = out.eye
+    if eye is None:
+        eye = out.eye = el.eyeAvailable()
+    # 0: left, 1: right, 2: binocular
+    if eye == 0 and sample.isLeftSample():
+        data = sample.getLeftEye()
+    elif eye == 1 and sample.isRightSample():
+        data = sample.getRightEye()
+    elif eye == 2:
+        return None
+    else:
+        raise Exception('Could not detect which eye has been tracked')
+    x, y = data.getGaze()
+    pupil = data.getPupilSize()
+
+    if x == pylink.MISSING_DATA or y == pylink.MISSING_DATA:
+        blinked = event == pylink.STARTBLINK or pupil == 0
+        if blinked and IgnoreBlinks:
+            hsmvd = False
+            x = targetLoc[0]
+            y = targetLoc[1]
+        else:
+            hsmvd = True
+    else:
+        # same as EyelinkToPsychopy(), without creating a tuple
+        x = x - dispsize[0]/2
+        y = dispsize[1]/2 - y
+        if VisAngle is not None:
+            dist = VisAngle.distance(x, y, targetLoc)
+        else:
+            dx = targetLoc[0] - x
+            dy = targetLoc[1] - y
+            dist = sqrt(dx * dx + dy * dy)
+            if PixPerDeg is not None:
+                dist = dist/PixPerDeg
+        hsmvd = dist > FixLen
+
+    out.x = x
+    out.y = y
+    out.hsmvd = hsmvd
+    out.pupilSize = pupil
+    return out
+
+
 def EyelinkSendTabMsg(infolist, el=pylink.getEYELINK()):
     """ Sends tab-delimited message to EDF
 
@@ -526,7 +740,7 @@ def EyelinkSendTabMsg(infolist, el=pylink.getEYELINK()):
     if not isinstance(infolist, list):
         infolist = [infolist]
     # prepend identifier if necessary
-    if infolist[0] is not '>':
+    if infolist[0] != '>':
         infolist.insert(0, '>')
     # make it a tab delimited list and convert everything to string
     msg = '\t'.join(str(i) for i in infolist)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark of ``EyelinkGetGaze`` vs. ``EyelinkGetGazeFast``.
+
+Replays synthetic samples (see ``tests/synthetic.py``) through both
+functions via a simulated tracker and reports the time per call. Runs
+against the pylink stand-in in ``tests/stubs``, no pylink installation is
+needed. That both return the same results is checked by
+``tests/test_getgaze.py``.
+
+Usage::
+
+    python benchmarks/bench_getgaze.py [--samples 200000]
+"""
+
+import argparse
+import os
+import sys
+from timeit import default_timer as clock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+sys.path.insert(0, os.path.join(ROOT, 'tests', 'stubs'))
+import pylink  # noqa: E402
+from EyelinkWrapper import (EyelinkGetGaze, EyelinkGetGazeFast,  # noqa: E402
+                            GazeInfo)
+from synthetic import (synthetic, SimulatedTracker, DISPSIZE,  # noqa: E402
+                       TARGET, FIXLEN, PIXPERDEG)
+
+
+def run(func, el, n, **kwargs):
+    el.i = -1
+    t0 = clock()
+    for i in range(n):
+        func(TARGET, FIXLEN, DISPSIZE, el=el, PixPerDeg=PIXPERDEG, **kwargs)
+    return clock() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--samples', type=int, default=200000)
+    args = parser.parse_args()
+
+    # samples without missing data (EyelinkGetGaze prints on those)
+    gx, gy, pupil, blinkStart, _ = synthetic(args.samples,
+                                             pylink.MISSING_DATA)
+    ok = (gx != pylink.MISSING_DATA) & (gy != pylink.MISSING_DATA)
+    el = SimulatedTracker(gx[ok].tolist(), gy[ok].tolist(),
+                          pupil[ok].tolist(), blinkStart[ok],
+                          pylink.STARTBLINK)
+    m = int(ok.sum())
+    tRef = min(run(EyelinkGetGaze, el, m) for r in range(3))
+    tFast = min(run(EyelinkGetGazeFast, el, m, out=GazeInfo())
+                for r in range(3))
+    print('%d samples\n' % m)
+    print('%-22s %10s' % ('', 'ns/call'))
+    print('%-22s %10.0f' % ('EyelinkGetGaze', tRef / m * 1e9))
+    print('%-22s %10.0f' % ('EyelinkGetGazeFast', tFast / m * 1e9))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""
+Poll-interval jitter with and without ``EyelinkRealtime.RecordingProfile``.
+
+Simulates the trial loop of an experiment: a 1000 Hz poll (busy-waiting for
+the next deadline, like polling ``EyelinkGetGaze`` for every sample) that
+creates some garbage on every iteration, including reference cycles, so the
+garbage collector kicks in regularly. Prints how late each poll came,
+once with the profile off and once with it on.
+
+Run it on an otherwise busy machine (e.g. with ``stress -c <ncpu>`` in
+another terminal) to see the effect of pinning and scheduling. SCHED_FIFO and
+mlockall need privileges; skipped steps are listed.
+
+Usage::
+
+    python benchmarks/bench_realtime_jitter.py [--seconds 10] [--cpus 3]
+                                               [--rt-priority 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from EyelinkRealtime import RecordingProfile  # noqa: E402
+
+
+def poll_loop(seconds, interval=0.001):
+    """ Returns the lateness (s) of every poll relative to its deadline. """
+    n = int(seconds / interval)
+    late = np.empty(n)
+    clock = time.perf_counter
+    keep = []
+    deadline = clock() + interval
+    for i in range(n):
+        while clock() < deadline:
+            pass
+        late[i] = clock() - deadline
+        deadline += interval
+        # per-poll garbage like a result dict and some bookkeeping; the
+        # cycle can only be freed by the garbage collector
+        node = {'x': float(i), 'y': -float(i), 'hsmvd': False, 'i': [i]}
+        node['self'] = node
+        keep.append([node] * 4)
+        if len(keep) > 200:
+            del keep[:100]
+    return late
+
+
+def report(name, late):
+    us = late * 1e6
+    print('%-12s %8.1f %8.1f %8.1f %8.1f %9d' % (
+        name, np.percentile(us, 50), np.percentile(us, 99),
+        np.percentile(us, 99.9), us.max(), (us > 500).sum()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--seconds', type=float, default=10.0)
+    parser.add_argument('--cpus', type=int, nargs='*', default=None)
+    parser.add_argument('--rt-priority', type=int, default=None)
+    parser.add_argument('--lock-memory', action='store_true')
+    args = parser.parse_args()
+
+    buffers = [np.zeros(int(args.seconds * 1000))]
+    profile = RecordingProfile(cpus=args.cpus, rtPriority=args.rt_priority,
+                               buffers=buffers, lockMemory=args.lock_memory)
+
+    off = poll_loop(args.seconds)
+    with profile:
+        on = poll_loop(args.seconds)
+        applied, skipped = list(profile.applied), list(profile.skipped)
+
+    print('profile applied: %s' % ', '.join(applied))
+    if skipped:
+        print('profile skipped: %s' % '; '.join(str(s) for s in skipped))
+    print('\nlateness [us]     p50      p99    p99.9      max  >0.5 ms')
+    report('profile off', off)
+    report('profile on', on)
+
+
+if __name__ == '__main__':
+    main()
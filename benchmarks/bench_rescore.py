@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+Times ``EyelinkRescoreFixation`` on several million synthetic samples.
+
+That it makes exactly the same decisions as ``EyelinkGetGaze`` is checked
+by ``tests/test_rescore.py``.
+
+Usage::
+
+    python benchmarks/bench_rescore.py [--samples 5000000]
+"""
+
+import argparse
+import os
+import sys
+from timeit import default_timer as clock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+from EyelinkRescore import EyelinkRescoreFixation  # noqa: E402
+from synthetic import (synthetic, DISPSIZE, TARGET, FIXLEN,  # noqa: E402
+                       PIXPERDEG)
+
+
+def bench(n, repeats=5):
+    gx, gy, pupil, blinkStart, trials = synthetic(n, -32768, nTrials=n // 2000)
+    times = []
+    for r in range(repeats):
+        t0 = clock()
+        _, perTrial = EyelinkRescoreFixation(
+            gx, gy, pupil, TARGET, FIXLEN, DISPSIZE, PixPerDeg=PIXPERDEG,
+            IgnoreBlinks=True, blinkStart=blinkStart, trials=trials)
+        times.append(clock() - t0)
+    print('%d samples, %d trials: best of %d %.3f s (%.1f ns/sample), '
+          '%d trials aborted' % (n, len(perTrial['trial']), repeats,
+                                 min(times), min(times) / n * 1e9,
+                                 perTrial['aborted'].sum()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--samples', type=int, default=5000000)
+    args = parser.parse_args()
+    bench(args.samples)
+
+
+if __name__ == '__main__':
+    main()
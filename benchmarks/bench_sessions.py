@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+Scaling benchmark for ``EyelinkSessionAsync``.
+
+Runs the life cycle of N rigs (start, calibration, a block of gaze polls and
+messages, stop incl. EDF transfer) once sequentially and once concurrently
+from a single asyncio loop and prints the wall-clock times.
+
+The rigs are real ``TrackerSession`` objects, i.e. everything in
+``EyelinkWrapper`` runs, but against the pylink stand-in from
+``tests/stubs``: ``msecDelay`` sleeps, and every calibration and EDF
+transfer take an assumed 2 s and 3 s. All delays are multiplied by
+``--scale``. As pylink's calibration graphics are process-global,
+calibrations of concurrent sessions run one after another, while starting,
+stopping and EDF transfers of other sessions go on. So the concurrent time
+can't drop below the sum of all calibrations (2 per session, i.e. 4 s,
+scaled). No tracker or pylink installation is needed.
+
+Usage::
+
+    python benchmarks/bench_sessions.py [--sessions 1 2 4 8 16] [--scale 0.1]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests', 'stubs'))
+import pylink  # noqa: E402
+from psychopy import visual  # noqa: E402
+from EyelinkSession import TrackerSession  # noqa: E402
+from EyelinkSessionAsync import AsyncTrackerSession  # noqa: E402
+
+DISPSIZE = (1920, 1080)
+
+
+def make_sessions(n, nPolls):
+    sessions = []
+    for i in range(n):
+        s = TrackerSession(DISPSIZE, 'rig%d' % i,
+                           win=visual.Window(DISPSIZE), dummy=True)
+        s.nPolls = nPolls
+        sessions.append(s)
+    return sessions
+
+
+def wait_sample():
+    # one sample at 1000 Hz
+    time.sleep(0.001 * pylink.DELAY_SCALE)
+
+
+def run_sequential(sessions):
+    for s in sessions:
+        s.start()
+        s.calibrate()
+        for i in range(s.nPolls):
+            wait_sample()
+            s.get_gaze((0, 0), 2)
+            s.send_msg(['poll', i])
+        s.stop()
+
+
+async def run_one(session):
+    async with AsyncTrackerSession(session) as s:
+        await s.start()
+        await s.calibrate()
+        for i in range(session.nPolls):
+            await asyncio.sleep(0.001 * pylink.DELAY_SCALE)
+            await s.get_gaze((0, 0), 2)
+            await s.send_msg(['poll', i])
+
+
+async def run_concurrent(sessions):
+    await asyncio.gather(*[run_one(s) for s in sessions])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sessions', type=int, nargs='+',
+                        default=[1, 2, 4, 8, 16])
+    parser.add_argument('--scale', type=float, default=0.1,
+                        help='factor applied to all simulated delays')
+    parser.add_argument('--polls', type=int, default=100)
+    args = parser.parse_args()
+    pylink.DELAY_SCALE = args.scale
+    # EyelinkStop creates ./EDF
+    os.chdir(tempfile.mkdtemp())
+
+    print('%8s %14s %14s %8s' % ('sessions', 'sequential [s]',
+                                 'concurrent [s]', 'speedup'))
+    for n in args.sessions:
+        # EyelinkStart/-Stop print progress, silence them here
+        stdout = sys.stdout
+        sys.stdout = open(os.devnull, 'w')
+        try:
+            sessions = make_sessions(n, args.polls)
+            t0 = time.perf_counter()
+            run_sequential(sessions)
+            tSeq = time.perf_counter() - t0
+
+            sessions = make_sessions(n, args.polls)
+            t0 = time.perf_counter()
+            asyncio.run(run_concurrent(sessions))
+            tCon = time.perf_counter() - t0
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        print('%8d %14.3f %14.3f %8.1f' % (n, tSeq, tCon, tSeq / tCon))
+
+
+if __name__ == '__main__':
+    main()
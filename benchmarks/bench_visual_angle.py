@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""
+Accuracy and speed of ``EyelinkCoords.VisualAngle``.
+
+Compares, for random gaze positions on a wide screen, the angle to a fixation
+target computed with a single pixels-per-degree factor (as ``EyelinkGetGaze``
+does with ``PixPerDeg``) to the exact angle, and times the exact computation
+per sample and vectorized.
+
+It also times the precomputed lookup tables ``VisualAngle`` does without:
+
+* per-axis tables: eccentricity (``pix2deg``) of every pixel column and
+  row, read by nearest index or by linear interpolation (``np.interp``);
+  the angle is then the distance of the eccentricities (not exact: that is
+  the approximation of psychopy's 'degFlatPos' units),
+* 2D table: exact angle to the target on a grid of ``--step`` px,
+  bilinearly interpolated (one table per target).
+
+Usage::
+
+    python benchmarks/bench_visual_angle.py [--samples 1000000]
+"""
+
+import argparse
+import os
+import sys
+from timeit import default_timer as clock
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from EyelinkCoords import VisualAngle  # noqa: E402
+
+DISPSIZE = (2560, 1080)    # 34" ultra-wide
+SCREENCM = (79.7, 33.6)
+VIEWDIST = 60.0
+TARGET = (600.0, -200.0)
+
+
+def best_of(func, args, repeats=5):
+    times = []
+    for r in range(repeats):
+        t0 = clock()
+        out = func(*args)
+        times.append(clock() - t0)
+    return out, min(times)
+
+
+class AxisTables(object):
+    """ Eccentricity of every pixel column and row. """
+
+    def __init__(self, va):
+        self.xhalf = DISPSIZE[0] // 2
+        self.yhalf = DISPSIZE[1] // 2
+        self.px = np.arange(-self.xhalf, DISPSIZE[0] - self.xhalf + 1.0)
+        self.py = np.arange(-self.yhalf, DISPSIZE[1] - self.yhalf + 1.0)
+        self.degX = va.pix2deg(self.px, 0)
+        self.degY = va.pix2deg(self.py, 1)
+        self.listX = self.degX.tolist()
+        self.listY = self.degY.tolist()
+        self.tX = float(va.pix2deg(TARGET[0], 0))
+        self.tY = float(va.pix2deg(TARGET[1], 1))
+
+    def nearest(self, x, y):
+        ix = np.rint(x).astype(int) + self.xhalf
+        iy = np.rint(y).astype(int) + self.yhalf
+        return np.hypot(self.degX[ix] - self.tX, self.degY[iy] - self.tY)
+
+    def interp(self, x, y):
+        return np.hypot(np.interp(x, self.px, self.degX) - self.tX,
+                        np.interp(y, self.py, self.degY) - self.tY)
+
+    def one(self, x, y):
+        dx = self.listX[int(round(x)) + self.xhalf] - self.tX
+        dy = self.listY[int(round(y)) + self.yhalf] - self.tY
+        return (dx * dx + dy * dy) ** 0.5
+
+
+class GridTable(object):
+    """ Exact angle to TARGET on a grid, bilinear interpolation. """
+
+    def __init__(self, va, step):
+        self.step = float(step)
+        self.x0 = -DISPSIZE[0] / 2.0
+        self.y0 = -DISPSIZE[1] / 2.0
+        gx = self.x0 + np.arange(DISPSIZE[0] // step + 2) * self.step
+        gy = self.y0 + np.arange(DISPSIZE[1] // step + 2) * self.step
+        self.table = va.angle(gx[None, :], gy[:, None], TARGET[0], TARGET[1])
+
+    def bilinear(self, x, y):
+        fx = (x - self.x0) / self.step
+        fy = (y - self.y0) / self.step
+        ix = np.minimum(fx.astype(int), self.table.shape[1] - 2)
+        iy = np.minimum(fy.astype(int), self.table.shape[0] - 2)
+        wx = fx - ix
+        wy = fy - iy
+        t = self.table
+        top = t[iy, ix] * (1 - wx) + t[iy, ix + 1] * wx
+        bottom = t[iy + 1, ix] * (1 - wx) + t[iy + 1, ix + 1] * wx
+        return top * (1 - wy) + bottom * wy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--samples', type=int, default=1000000)
+    parser.add_argument('--step', type=int, default=8,
+                        help='grid spacing of the 2D table in px')
+    args = parser.parse_args()
+    n = args.samples
+
+    va = VisualAngle(DISPSIZE, SCREENCM, VIEWDIST)
+    rng = np.random.RandomState(0)
+    x = rng.uniform(-DISPSIZE[0] / 2, DISPSIZE[0] / 2, n)
+    y = rng.uniform(-DISPSIZE[1] / 2, DISPSIZE[1] / 2, n)
+
+    exact, tExact = best_of(va.distance, (x, y, TARGET))
+    ppd = va.PixPerDeg
+    linear, tLinear = best_of(
+        lambda x, y: np.hypot(x - TARGET[0], y - TARGET[1]) / ppd, (x, y))
+    err = np.abs(linear - exact)
+    print('PixPerDeg (%.1f px/deg) vs. exact: max error %.2f deg, '
+          'mean %.3f deg' % (ppd, err.max(), err.mean()))
+    far = np.hypot(x, y) > DISPSIZE[0] / 3.0
+    print('  gaze further than %d px from center: mean error %.3f deg'
+          % (DISPSIZE[0] / 3, err[far].mean()))
+
+    axes = AxisTables(va)
+    t0 = clock()
+    grid = GridTable(va, args.step)
+    tBuild = clock() - t0
+    variants = [
+        ('linear PixPerDeg, vectorized', linear, tLinear),
+        ('exact angle, vectorized', exact, tExact),
+        ('per-axis table, nearest',) + best_of(axes.nearest, (x, y)),
+        ('per-axis table, np.interp',) + best_of(axes.interp, (x, y)),
+        ('2D table (%d px), bilinear' % args.step,) +
+        best_of(grid.bilinear, (x, y)),
+    ]
+
+    m = min(n, 200000)
+    xs = x[:m].tolist()
+    ys = y[:m].tolist()
+    tScalar = []
+    for func in (va.distance, lambda x, y, t: axes.one(x, y)):
+        t0 = clock()
+        for i in range(m):
+            func(xs[i], ys[i], TARGET)
+        tScalar.append((clock() - t0) / m)
+
+    print('\n%-34s %9s %14s' % ('', 'ns/sample', 'max error deg'))
+    for name, out, t in variants:
+        print('%-34s %9.1f %14.4f' % (name, t / n * 1e9,
+                                      np.abs(out - exact).max()))
+    print('%-34s %9.1f' % ('exact angle, one sample', tScalar[0] * 1e9))
+    print('%-34s %9.1f %14s' % ('per-axis table, one sample',
+                                tScalar[1] * 1e9, '(as nearest)'))
+    print('\nbuilding the 2D table for one target: %.1f ms' % (tBuild * 1e3))
+
+
+if __name__ == '__main__':
+    main()
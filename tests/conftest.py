@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""
+The modules are tested against the stand-ins in ``tests/stubs`` for pylink,
+psychopy and PIL (see ``stubs/pylink.py``), so no tracker, screen or
+Developer Pack is needed. They shadow installed versions on purpose.
+"""
+
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.join(HERE, 'stubs'))
+
+
+@pytest.fixture
+def pylink(tmp_path, monkeypatch):
+    """ The stub pylink with an empty call log. Runs in a temporary
+    directory, because ``EyelinkStop`` creates ``./EDF``. """
+    import pylink
+    pylink.reset()
+    monkeypatch.chdir(tmp_path)
+    return pylink
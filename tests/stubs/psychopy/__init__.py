@@ -0,0 +1,3 @@
+# -*- coding: utf-8 -*-
+""" Stand-in for the parts of psychopy used by EyeLinkCoreGraphicsPsychoPy,
+so the calibration display can be created without a screen. """
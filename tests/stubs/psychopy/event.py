@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+
+
+class Mouse(object):
+    def __init__(self, visible=True):
+        self.visible = visible
+        self.pos = (0, 0)
+
+    def setPos(self, pos):
+        self.pos = pos
+
+    def getPos(self):
+        return self.pos
+
+    def getPressed(self):
+        return [0, 0, 0]
+
+
+def getKeys(*args, **kwargs):
+    return []
@@ -0,0 +1,17 @@
+# -*- coding: utf-8 -*-
+
+
+class Monitor(object):
+    def __init__(self, sizePix=(1920, 1080), width=53.1, distance=57.0):
+        self.sizePix = sizePix
+        self.width = width
+        self.distance = distance
+
+    def getWidth(self):
+        return self.width
+
+    def getDistance(self):
+        return self.distance
+
+    def getSizePix(self):
+        return self.sizePix
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+from psychopy.monitors import Monitor
+
+
+class _Stim(object):
+    """ Accepts any arguments and attributes; drawing does nothing. """
+
+    def __init__(self, win=None, *args, **kwargs):
+        self.win = win
+        self.__dict__.update(kwargs)
+
+    def setPos(self, pos):
+        self.pos = pos
+
+    def draw(self):
+        pass
+
+
+TextStim = Line = GratingStim = ShapeStim = ImageStim = _Stim
+
+
+class Window(object):
+    def __init__(self, size=(1920, 1080), units='pix', color=(0, 0, 0),
+                 monitor=None):
+        self.size = size
+        self.units = units
+        self.color = color
+        self.monitor = monitor if monitor is not None else Monitor(size)
+        self.mouseVisible = True
+        self.nFlips = 0
+
+    def flip(self):
+        self.nFlips += 1
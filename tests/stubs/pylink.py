@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""
+Stand-in for SR Research's pylink, used by the tests and benchmarks.
+
+Provides the constants and the parts of the tracker interface that
+``EyelinkWrapper`` uses, without a tracker or the Developer Pack. Blocking
+calls sleep for their nominal duration times ``DELAY_SCALE`` (0 by default,
+i.e. they return immediately). Process-global calls are logged in ``calls``.
+"""
+
+import time
+
+MISSING_DATA = -32768
+STARTBLINK = 3
+ENDBLINK = 4
+
+# keys
+JUNK_KEY = 1
+F1_KEY, F2_KEY, F3_KEY, F4_KEY, F5_KEY = 0x3B00, 0x3C00, 0x3D00, 0x3E00, 0x3F00
+F6_KEY, F7_KEY, F8_KEY, F9_KEY, F10_KEY = 0x4000, 0x4100, 0x4200, 0x4300, 0x4400
+PAGE_UP, PAGE_DOWN = 0x4900, 0x5100
+CURS_UP, CURS_DOWN, CURS_LEFT, CURS_RIGHT = 0x4800, 0x5000, 0x4B00, 0x4D00
+ENTER_KEY, ESC_KEY = 0x0D, 0x1B
+
+# colors
+CR_HAIR_COLOR, PUPIL_HAIR_COLOR, PUPIL_BOX_COLOR = 1, 2, 3
+SEARCH_LIMIT_BOX_COLOR, MOUSE_CURSOR_COLOR = 4, 5
+
+# factor applied to all simulated delays
+DELAY_SCALE = 0.0
+# log of process-global calls, e.g. ('closeGraphics',)
+calls = []
+# display passed to the last openGraphicsEx(), None after closeGraphics()
+graphics = None
+_tracker = None
+
+
+def reset():
+    """ Forgets all calls and the open graphics. """
+    global graphics, _tracker
+    del calls[:]
+    graphics = None
+    _tracker = None
+
+
+def _sleep(seconds):
+    if DELAY_SCALE:
+        time.sleep(seconds * DELAY_SCALE)
+
+
+def getEYELINK():
+    return _tracker
+
+
+def msecDelay(ms):
+    _sleep(ms / 1000.0)
+
+
+def beginRealTimeMode(delay):
+    calls.append(('beginRealTimeMode',))
+    msecDelay(delay)
+
+
+def endRealTimeMode():
+    calls.append(('endRealTimeMode',))
+
+
+def openGraphicsEx(genv):
+    global graphics
+    calls.append(('openGraphicsEx', genv))
+    graphics = genv
+
+
+def closeGraphics():
+    global graphics
+    calls.append(('closeGraphics',))
+    graphics = None
+
+
+def flushGetkeyQueue():
+    pass
+
+
+class KeyInput(object):
+    def __init__(self, key, mod=0):
+        self.key = key
+        self.mod = mod
+
+
+class EyeLinkCustomDisplay(object):
+    def __init__(self):
+        pass
+
+
+class EyeLink(object):
+    """ Dummy tracker. ``setups`` lists the display that was open during
+    every ``doTrackerSetup``/``doDriftCorrect``. """
+    # nominal durations in s
+    setupTime = 2.0
+    transferTime = 3.0
+
+    def __init__(self, address=None):
+        global _tracker
+        _tracker = self
+        self.address = address
+        self.messages = []
+        self.commands = []
+        self.setups = []
+        self.isRecording = False
+        self.isOpen = True
+
+    def openDataFile(self, name):
+        self.dataFile = name
+
+    def closeDataFile(self):
+        pass
+
+    def receiveDataFile(self, src, dest):
+        _sleep(self.transferTime)
+
+    def sendCommand(self, command):
+        self.commands.append(command)
+
+    def sendMessage(self, message):
+        self.messages.append(message)
+
+    def setOfflineMode(self):
+        pass
+
+    def getTrackerVersion(self):
+        return 3
+
+    def getTrackerVersionString(self):
+        return 'EYELINK CL 5.15'
+
+    def doTrackerSetup(self, width=None, height=None):
+        self.setups.append(graphics)
+        _sleep(self.setupTime)
+
+    def doDriftCorrect(self, x, y, draw, allowSetup):
+        self.setups.append(graphics)
+        return 0
+
+    def startRecording(self, *args):
+        self.isRecording = True
+
+    def stopRecording(self):
+        self.isRecording = False
+
+    def getNewestSample(self):
+        return None
+
+    def getNextData(self):
+        return 0
+
+    def eyeAvailable(self):
+        return 0
+
+    def close(self):
+        self.isOpen = False
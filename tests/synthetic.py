@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+Synthetic gaze data and a simulated tracker that replays it through the
+pylink interface used by ``EyelinkGetGaze``. Shared by the tests and
+``benchmarks/``.
+"""
+
+import numpy as np
+
+from EyelinkCoords import VisualAngle
+
+DISPSIZE = (1920, 1080)
+TARGET = (0, 0)
+FIXLEN = 2.0
+PIXPERDEG = 35.0
+VISANGLE = VisualAngle(DISPSIZE, (53.1, 29.9), 57.0)
+
+
+def synthetic(n, missingValue, nTrials=100, seed=0):
+    """ gaze (Eyelink coordinates), pupil, blink-start flags, trial labels """
+    rng = np.random.RandomState(seed)
+    gx = DISPSIZE[0] / 2.0 + rng.normal(0, 25, n)
+    gy = DISPSIZE[1] / 2.0 + rng.normal(0, 25, n)
+    pupil = rng.uniform(800, 1200, n)
+    blinkStart = np.zeros(n, dtype=bool)
+    # saccades away from the target
+    for s in rng.randint(0, n, n // 500):
+        gx[s:s + 40] += rng.uniform(-300, 300)
+        gy[s:s + 40] += rng.uniform(-300, 300)
+    # blinks: missing gaze, pupil 0, sometimes with a STARTBLINK event
+    for s in rng.randint(0, n, n // 1000):
+        gx[s:s + 100] = missingValue
+        gy[s:s + 100] = missingValue
+        pupil[s:s + 100] = 0
+        blinkStart[s] = rng.rand() < 0.5
+    # missing data with valid pupil
+    lost = rng.rand(n) < 0.001
+    gx[lost] = missingValue
+    trials = np.repeat(np.arange(nTrials), int(np.ceil(n / float(nTrials))))[:n]
+    return gx, gy, pupil, blinkStart, trials
+
+
+class SimulatedTracker(object):
+    """ Replays recorded samples through the pylink tracker interface used
+    by ``EyelinkGetGaze`` (left eye only). """
+
+    def __init__(self, gx, gy, pupil, blinkStart, STARTBLINK):
+        self.gx, self.gy, self.pupil = gx, gy, pupil
+        self.blinkStart = blinkStart
+        self.STARTBLINK = STARTBLINK
+        self.i = -1
+
+    # sample & eye data
+    def isLeftSample(self):
+        return True
+
+    def getLeftEye(self):
+        return self
+
+    def getGaze(self):
+        return (self.gx[self.i], self.gy[self.i])
+
+    def getPupilSize(self):
+        return self.pupil[self.i]
+
+    # tracker
+    def getNewestSample(self):
+        self.i += 1
+        return self
+
+    def getNextData(self):
+        return self.STARTBLINK if self.blinkStart[self.i] else 0
+
+    def eyeAvailable(self):
+        return 0
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+from math import atan, degrees
+
+import numpy as np
+import pytest
+
+from EyelinkCoords import VisualAngle, EyelinkToPsychopy, PsychopyToEyelink
+
+DISPSIZE = (1920, 1080)
+SCREENCM = (53.1, 29.9)
+
+
+@pytest.mark.parametrize('eyeOffset', [(0, 0), (3.0, -2.5)])
+def test_pix2deg_round_trip(eyeOffset):
+    va = VisualAngle(DISPSIZE, SCREENCM, 57.0, eyeOffset=eyeOffset)
+    pix = np.linspace(-960, 960, 41)
+    for axis in (0, 1):
+        assert np.allclose(va.deg2pix(va.pix2deg(pix, axis), axis), pix)
+    # the point straight ahead of the eye is at 0 degree
+    for axis in (0, 1):
+        straight = eyeOffset[axis] / va.cmPerPix[axis]
+        assert va.pix2deg(straight, axis) == pytest.approx(0, abs=1e-12)
+    # independent of the implementation
+    x = 700.0
+    cm = x * SCREENCM[0] / DISPSIZE[0] - eyeOffset[0]
+    assert va.pix2deg(x, 0) == pytest.approx(degrees(atan(cm / 57.0)))
+
+
+def test_angle_known_case():
+    # 1 cm on a screen 57 cm away, straight ahead: 1.005 degree
+    va = VisualAngle((1000, 1000), (100.0, 100.0), 57.0)
+    assert va.angle(0, 0, 10, 0) == pytest.approx(degrees(atan(1 / 57.0)))
+    assert va.angle(0, 0, 10, 0) == pytest.approx(1.005, abs=1e-3)
+    assert va.angle(0, 0, 0, -10) == pytest.approx(1.005, abs=1e-3)
+    # 1 cm further out covers less visual angle
+    outer = va.angle(400, 0, 410, 0)
+    assert outer == pytest.approx(degrees(atan(41 / 57.0) - atan(40 / 57.0)))
+    assert va.angle(123, -45, 123, -45) == 0
+
+
+def test_distance_scalar_matches_angle():
+    va = VisualAngle(DISPSIZE, SCREENCM, 57.0, eyeOffset=(1.0, 2.0))
+    rng = np.random.RandomState(0)
+    x = rng.uniform(-960, 960, 200)
+    y = rng.uniform(-540, 540, 200)
+    target = (300.0, -100.0)
+    vec = va.distance(x, y, target)
+    assert np.allclose(vec, va.angle(x, y, target[0], target[1]))
+    scalar = [va.distance(float(a), float(b), target) for a, b in zip(x, y)]
+    assert np.allclose(scalar, vec, rtol=0, atol=1e-12)
+    assert va.distance(0, 0, target) == pytest.approx(
+        float(va.angle(0, 0, target[0], target[1])))
+
+
+def test_eyelink_psychopy_round_trip():
+    x, y = EyelinkToPsychopy(0, 0, DISPSIZE)
+    assert (x, y) == (-960, 540)
+    assert PsychopyToEyelink(x, y, DISPSIZE) == (0, 0)
+
+
+@pytest.mark.parametrize('units', ['degFlat', 'degFlatPos'])
+def test_cal_target_deg_flat(pylink, units):
+    from psychopy import visual
+    from psychopy.monitors import Monitor
+    from EyeLinkCoreGraphicsPsychoPy import EyeLinkCoreGraphicsPsychoPy
+    win = visual.Window(DISPSIZE, units=units,
+                        monitor=Monitor(DISPSIZE, width=53.1, distance=57.0))
+    genv = EyeLinkCoreGraphicsPsychoPy(pylink.EyeLink(), win)
+    cmPerPix = 53.1 / 1920
+    for x, y in [(960, 540), (1800, 100), (150, 1000)]:
+        genv.draw_cal_target(x, y)
+        xDeg, yDeg = genv.calTargetOut.pos
+        # what psychopy's flat-screen units expect: arctan per axis
+        assert xDeg == pytest.approx(
+            degrees(atan((x - 960) * cmPerPix / 57.0)))
+        assert yDeg == pytest.approx(
+            degrees(atan((540 - y) * cmPerPix / 57.0)))
+        assert genv.calTargetIn.pos == genv.calTargetOut.pos
+
+
+def test_cal_target_deg_linear(pylink):
+    from psychopy import visual
+    from psychopy.monitors import Monitor
+    from EyeLinkCoreGraphicsPsychoPy import EyeLinkCoreGraphicsPsychoPy
+    win = visual.Window(DISPSIZE, units='deg',
+                        monitor=Monitor(DISPSIZE, width=53.1, distance=57.0))
+    genv = EyeLinkCoreGraphicsPsychoPy(pylink.EyeLink(), win)
+    genv.draw_cal_target(1800, 540)
+    assert genv.visualAngle is None
+    assert genv.calTargetOut.pos[0] == pytest.approx(840 * genv.cfX)
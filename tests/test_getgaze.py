@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from synthetic import (synthetic, SimulatedTracker, DISPSIZE, TARGET, FIXLEN,
+                       PIXPERDEG, VISANGLE)
+
+N = 20000
+FIELDS = ('x', 'y', 'hsmvd', 'pupilSize')
+
+
+@pytest.mark.parametrize('VisAngle', [None, VISANGLE])
+@pytest.mark.parametrize('IgnoreBlinks', [False, True])
+def test_same_as_getgaze(pylink, IgnoreBlinks, VisAngle):
+    from EyelinkWrapper import EyelinkGetGaze, EyelinkGetGazeFast, GazeInfo
+    gx, gy, pupil, blinkStart, _ = synthetic(N, pylink.MISSING_DATA)
+    el = SimulatedTracker(gx.tolist(), gy.tolist(), pupil.tolist(),
+                          blinkStart, pylink.STARTBLINK)
+    kwargs = dict(el=el, PixPerDeg=PIXPERDEG, IgnoreBlinks=IgnoreBlinks,
+                  VisAngle=VisAngle)
+    ref = [EyelinkGetGaze(TARGET, FIXLEN, DISPSIZE, **kwargs)
+           for i in range(N)]
+    el.i = -1
+    out = GazeInfo()
+    for g in ref:
+        fast = EyelinkGetGazeFast(TARGET, FIXLEN, DISPSIZE, out=out,
+                                  **kwargs)
+        assert fast is out
+        assert fast.asdict() == g
+
+
+def test_gazeinfo_reads_like_dict():
+    from EyelinkWrapper import GazeInfo
+    g = GazeInfo()
+    g.x, g.y, g.hsmvd, g.pupilSize = 1.0, 2.0, True, 900.0
+    ref = g.asdict()
+    assert dict(g.items()) == ref
+    assert sorted(g.keys()) == sorted(ref) == sorted(g)
+    assert sorted(g.values()) == sorted(ref.values())
+    assert len(g) == 4
+    assert g['hsmvd'] is True and g.get('x') == 1.0
+    assert 'pupilSize' in g and 'eye' not in g
+    assert g.get('eye') is None and g.get('z', 0) == 0
+    with pytest.raises(KeyError):
+        g['eye']
+
+
+class Binocular(object):
+    """ Sample of both eyes; the left eye looks at (1, 1), the right one at
+    (2, 2). """
+
+    def __init__(self, pos):
+        self.pos = pos
+
+    def isLeftSample(self):
+        return True
+
+    def isRightSample(self):
+        return True
+
+    def getLeftEye(self):
+        return Binocular(1.0)
+
+    def getRightEye(self):
+        return Binocular(2.0)
+
+    def getGaze(self):
+        return (self.pos, self.pos)
+
+    def getPupilSize(self):
+        return 900.0
+
+
+@pytest.mark.parametrize('recalibrate', ['EyelinkCalibrate',
+                                         'EyelinkDriftCheck'])
+def test_recalibration_resets_eye(pylink, recalibrate):
+    import EyelinkWrapper
+    el = pylink.EyeLink()
+    eyes = [0]
+    el.eyeAvailable = lambda: eyes[0]
+    el.getNewestSample = lambda: Binocular(None)
+
+    def poll():
+        return EyelinkWrapper.EyelinkGetGazeFast(TARGET, FIXLEN, DISPSIZE,
+                                                 el=el)
+    EyelinkWrapper._gazeInfo.eye = None
+    left = poll()['x']
+    assert poll().eye == 0
+    # after the recalibration, the right eye is tracked
+    eyes[0] = 1
+    getattr(EyelinkWrapper, recalibrate)(DISPSIZE, el=el)
+    g = poll()
+    assert g.eye == 1
+    assert g['x'] == left + 1
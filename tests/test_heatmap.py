@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from EyelinkHeatmap import GazeHeatmap
+
+DISPSIZE = (1920, 1080)
+
+
+@pytest.mark.parametrize('binSize, sigma', [(10, None), (10, 15),
+                                            (40, 200), (100, 1000)])
+def test_add_samples_same_as_add(binSize, sigma):
+    rng = np.random.RandomState(0)
+    x = rng.uniform(-1000, 1000, 500)
+    y = rng.uniform(-600, 600, 500)
+    w = rng.uniform(0, 2, 500)
+    one = GazeHeatmap(DISPSIZE, binSize=binSize, sigma=sigma)
+    for xi, yi, wi in zip(x, y, w):
+        one.add(xi, yi, weight=wi)
+    many = GazeHeatmap(DISPSIZE, binSize=binSize, sigma=sigma)
+    many.add_samples(x, y, weights=w)
+    assert many.layer().shape == (many.ny, many.nx)
+    assert np.allclose(one.layer(), many.layer())
+    assert np.isclose(one.weights['all'], many.weights['all'])
+
+
+def test_kernel_longer_than_grid():
+    # 27 rows, kernel of 31 taps
+    heatmap = GazeHeatmap(DISPSIZE, binSize=40, sigma=200)
+    assert len(heatmap.kernel1D) > heatmap.ny
+    heatmap.add_samples([0, 100], [0, -100])
+    assert heatmap.layer().shape == (heatmap.ny, heatmap.nx)
+
+
+def test_save_tuple_conditions(tmp_path):
+    heatmap = GazeHeatmap(DISPSIZE, conditions=[('left', 1), 'right'])
+    heatmap.add(0, 0, condition=('left', 1))
+    heatmap.save(str(tmp_path / 'heatmap.npz'))
+    data = np.load(str(tmp_path / 'heatmap.npz'))
+    assert data["layer_('left', 1)"].sum() == 1
+    assert data['layer_right'].sum() == 0
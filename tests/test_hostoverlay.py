@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from EyelinkCoords import VisualAngle, EyelinkToPsychopy
+from EyelinkHostOverlay import HostOverlay
+
+DISPSIZE = (1920, 1080)
+# close to the screen, so that a pixels-per-degree circle is visibly off
+VISANGLE = VisualAngle(DISPSIZE, (53.1, 29.9), 40.0)
+
+
+class Tracker(object):
+    def __init__(self):
+        self.commands = []
+
+    def sendCommand(self, command):
+        self.commands.append(command)
+
+
+def circle(overlay, name='fixation'):
+    points = []
+    for command in overlay.scene[name]:
+        if command.startswith('draw_line'):
+            x1, y1 = [int(v) for v in command.split()[1:3]]
+            points.append(EyelinkToPsychopy(x1, y1, DISPSIZE))
+    return points
+
+
+@pytest.mark.parametrize('targetLoc', [(0, 0), (700, 400), (-900, -100)])
+def test_fixation_visual_angle(targetLoc):
+    overlay = HostOverlay(Tracker(), DISPSIZE)
+    overlay.fixation(targetLoc, 3.0, VisAngle=VISANGLE)
+    points = circle(overlay)
+    assert len(points) == 16
+    for x, y in points:
+        # exact up to rounding to whole pixels
+        assert VISANGLE.distance(float(x), float(y), targetLoc) == \
+            pytest.approx(3.0, abs=0.05)
+
+
+def test_fixation_pixperdeg_differs_off_center():
+    overlay = HostOverlay(Tracker(), DISPSIZE)
+    overlay.fixation((700, 400), 3.0, PixPerDeg=VISANGLE.PixPerDeg)
+    dist = [VISANGLE.distance(float(x), float(y), (700, 400))
+            for x, y in circle(overlay)]
+    assert max(abs(d - 3.0) for d in dist) > 0.3
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def flush_all(overlay):
+    """ Flushes until nothing is left; returns the number of flushes. """
+    n = 0
+    while overlay.flush():
+        n += 1
+    return n
+
+
+def test_new_elements_only_drawn():
+    el = Tracker()
+    overlay = HostOverlay(el, DISPSIZE, maxCommands=None)
+    overlay.fixation((0, 0), 2.0, VisAngle=VISANGLE)
+    n = overlay.flush()
+    assert el.commands[0] == 'clear_screen 0' and n == len(el.commands) == 18
+    assert overlay.flush() == 0
+    overlay.aoi('left', (-400, 0, 200, 200))
+    assert overlay.flush() == 1
+    assert el.commands[-1].startswith('draw_box')
+
+
+@pytest.mark.parametrize('change', ['changed', 'removed'])
+def test_changed_or_removed_element_redraws(change):
+    el = Tracker()
+    overlay = HostOverlay(el, DISPSIZE, maxCommands=None)
+    overlay.fixation((0, 0), 2.0, VisAngle=VISANGLE)
+    overlay.aoi('left', (-400, 0, 200, 200))
+    overlay.aoi('right', (400, 0, 200, 200))
+    overlay.flush()
+    del el.commands[:]
+    if change == 'changed':
+        overlay.aoi('left', (-300, 0, 200, 200))
+    else:
+        overlay.remove('right')
+    overlay.flush()
+    expected = ['clear_screen 0']
+    for commands in overlay.scene.values():
+        expected.extend(commands)
+    assert el.commands == expected
+    assert overlay.flush() == 0
+
+
+def test_default_spreads_commands_over_flushes():
+    el = Tracker()
+    overlay = HostOverlay(el, DISPSIZE)
+    assert overlay.maxCommands == 8
+    overlay.fixation((0, 0), 2.0, PixPerDeg=35.0)
+    overlay.aoi('left', (-400, 0, 200, 200), label='L')
+    sent = []
+    while True:
+        n = overlay.flush()
+        if not n:
+            break
+        sent.append(n)
+    # clear_screen + 17 fixation + 2 aoi commands
+    assert sent == [8, 8, 4]
+    assert el.commands[0] == 'clear_screen 0' and len(el.commands) == 20
+    # a change while commands are pending restarts the redraw
+    overlay.fixation((100, 0), 2.0, PixPerDeg=35.0)
+    overlay.flush()
+    overlay.remove('left')
+    del el.commands[:]
+    flush_all(overlay)
+    assert el.commands[0] == 'clear_screen 0'
+    assert el.commands.count('clear_screen 0') == 1
+    assert len(el.commands) == 18
+
+
+def test_status_rate_limited_and_deduplicated():
+    el = Tracker()
+    clock = Clock()
+    overlay = HostOverlay(el, DISPSIZE, statusInterval=0.5, clock=clock)
+    # the first flush clears the (unknown) host display
+    assert overlay.flush() == 1
+    del el.commands[:]
+    overlay.status('trial 1')
+    assert overlay.flush() == 1
+    assert el.commands == ["record_status_message 'trial 1'"]
+    # unchanged: nothing sent, no matter how much time passed
+    clock.now = 10.0
+    assert overlay.flush() == 0
+    overlay.status('trial 2')
+    assert overlay.flush() == 1
+    # changed, but too soon after the last one: only the latest is sent,
+    # once statusInterval has passed
+    overlay.status('trial 3')
+    clock.now = 10.1
+    assert overlay.flush() == 0
+    overlay.status('trial 4')
+    clock.now = 10.4
+    assert overlay.flush() == 0
+    clock.now = 10.5
+    assert overlay.flush() == 1
+    assert el.commands == ["record_status_message 'trial 1'",
+                           "record_status_message 'trial 2'",
+                           "record_status_message 'trial 4'"]
+
+
+def test_invalidate_redraws_and_resends_status():
+    el = Tracker()
+    clock = Clock()
+    overlay = HostOverlay(el, DISPSIZE, maxCommands=None, clock=clock)
+    overlay.aoi('left', (-400, 0, 200, 200))
+    overlay.status('block 1')
+    overlay.flush()
+    assert overlay.flush() == 0
+    # e.g. a recalibration cleared the host display
+    overlay.invalidate()
+    del el.commands[:]
+    clock.now = 1.0
+    overlay.flush()
+    assert el.commands == ['clear_screen 0'] + list(overlay.scene['left']) + \
+        ["record_status_message 'block 1'"]
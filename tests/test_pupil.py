@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from EyelinkPupil import OnlinePupil
+from EyelinkSession import TrackerSession
+
+DISPSIZE = (1920, 1080)
+
+
+def trace(samples, **kwargs):
+    pupil = OnlinePupil(maxTrials=2, maxSamples=100, baselineSamples=2,
+                        **kwargs)
+    pupil.message(['>', 'trialOnset', 1])
+    for p in samples:
+        pupil.add_sample(p)
+    pupil.end_trial()
+    return pupil.trial_trace(0)
+
+
+def test_blink_interpolated():
+    t = trace([10, 10, 0, None, 0, 14, 14], blinkPad=0)
+    assert np.allclose(t, [10, 10, 11, 12, 13, 14, 14])
+
+
+def test_blink_pad():
+    t = trace([10, 0, 20, 20, 20], blinkPad=2)
+    assert np.allclose(t, [10, 12.5, 15, 17.5, 20])
+
+
+def test_gaps_at_start_and_end():
+    t = trace([0, 0, 12, 12, 0], blinkPad=0)
+    assert np.allclose(t, [12, 12, 12, 12, 12])
+
+
+def feed(pupil, samples):
+    for p in samples:
+        pupil.add_sample(p)
+
+
+@pytest.mark.parametrize('mode, responses', [
+    ('subtractive', [2.0, 6.0]),
+    ('divisive', [13 / 11.0, 17 / 11.0])])
+def test_baseline_and_responses(mode, responses):
+    pupil = OnlinePupil(maxTrials=2, maxSamples=10, baselineSamples=2,
+                        blinkPad=0, mode=mode)
+    pupil.message(['trialOnset', 1])
+    feed(pupil, [10, 12])
+    assert pupil.baseline == 11
+    assert np.isnan(pupil.response)
+    feed(pupil, [13, 17])
+    assert np.isclose(pupil.response, responses[1])
+    pupil.end_trial()
+    assert pupil.baselines[0] == 11
+    assert np.isclose(pupil.peakResponses[0], max(responses))
+    assert np.isclose(pupil.meanResponses[0], np.mean(responses))
+    assert pupil.nSamples[0] == 4
+    assert np.isnan(pupil.baselines[1])
+
+
+def test_window_after_wrap():
+    pupil = OnlinePupil(maxTrials=1, maxSamples=20, baselineSamples=1,
+                        window=4, blinkPad=0)
+    pupil.start_trial()
+    feed(pupil, [1, 2, 3, 4, 5, 6, 0])
+    # window holds 4, 5, 6 and the blink
+    assert np.isclose(pupil.windowMean, 5)
+    assert np.isclose(pupil.windowStd, np.std([4, 5, 6]))
+    assert pupil.validFraction == 0.75
+    feed(pupil, [0, 0, 0])
+    assert np.isnan(pupil.windowMean) and np.isnan(pupil.windowStd)
+    assert pupil.validFraction == 0
+
+
+def test_trial_end_marker():
+    pupil = OnlinePupil(maxTrials=2, maxSamples=10, baselineSamples=1,
+                        trialEndMarker='trialEnd')
+    pupil.message(['>', 'trialOnset', 1])
+    feed(pupil, [10, 11, 12])
+    pupil.message(['>', 'trialEnd', 1])
+    feed(pupil, [13, 14])
+    assert pupil.nSamples[0] == 3
+    assert pupil.peakResponses[0] == 2
+    pupil.message(['>', 'trialOnset', 2])
+    assert pupil.trial == 1
+
+
+def test_more_trials_than_reserved():
+    pupil = OnlinePupil(maxTrials=2, maxSamples=10, baselineSamples=1)
+    for trial in range(4):
+        pupil.message(['trialOnset', trial])
+        feed(pupil, [10, 11])
+    pupil.end_trial()
+    assert pupil.trial == 1
+    assert pupil.nDroppedTrials == 2
+    assert list(pupil.nSamples) == [2, 2]
+    assert np.isnan(pupil.response)
+
+
+def test_aligned_by_session(pylink):
+    session = TrackerSession(DISPSIZE, 'sub01', el=pylink.EyeLink())
+    pupil = OnlinePupil(maxTrials=2, maxSamples=10, baselineSamples=1)
+    session.msgListeners.append(pupil)
+    msg = ['trialOnset', 1]
+    session.send_msg(msg)
+    # EyelinkSendTabMsg prepends the marker to the caller's list
+    assert msg[0] == '>'
+    assert pupil.trial == 0
+    feed(pupil, [10, 12])
+    session.send_msg(['stimOnset', 1])
+    session.send_msg(['trialOnset', 2])
+    assert pupil.trial == 1
+    assert pupil.peakResponses[0] == 2
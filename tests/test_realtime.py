@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+import gc
+import weakref
+
+import pytest
+
+from EyelinkRealtime import RecordingProfile
+
+
+class Node(object):
+    pass
+
+
+def cycle():
+    a, b = Node(), Node()
+    a.other, b.other = b, a
+    return weakref.ref(a)
+
+
+@pytest.mark.parametrize('gcMode', ['freeze', 'disable'])
+def test_collect_between_trials(gcMode):
+    wasEnabled = gc.isenabled()
+    profile = RecordingProfile(nice=None, gcMode=gcMode)
+    with profile:
+        assert not gc.isenabled()
+        # cycles created while recording are never freed automatically
+        refs = [cycle() for i in range(1000)]
+        assert all(ref() is not None for ref in refs)
+        assert profile.collect() >= 2000
+        assert all(ref() is None for ref in refs)
+        assert not gc.isenabled()
+    assert gc.isenabled() == wasEnabled
+
+
+def test_frozen_before_enter_collected():
+    kept = Node()
+    kept.self = kept
+    ref = weakref.ref(kept)
+    profile = RecordingProfile(nice=None, gcMode='freeze')
+    with profile:
+        del kept
+        assert ref() is not None
+        profile.collect()
+        assert ref() is None
+
+
+def test_overlapping_profiles():
+    wasEnabled = gc.isenabled()
+    a = RecordingProfile(nice=None, gcMode='freeze')
+    b = RecordingProfile(nice=None, gcMode='freeze')
+    a.enter()
+    b.enter()
+    # not nested: a exits while b is still recording
+    a.exit()
+    assert not gc.isenabled()
+    if hasattr(gc, 'get_freeze_count'):
+        assert gc.get_freeze_count() > 0
+    b.exit()
+    assert gc.isenabled() == wasEnabled
+    if hasattr(gc, 'get_freeze_count'):
+        assert gc.get_freeze_count() == 0
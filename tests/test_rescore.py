@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+
+from EyelinkRescore import EyelinkRescoreFixation
+from synthetic import (synthetic, SimulatedTracker, DISPSIZE, TARGET, FIXLEN,
+                       PIXPERDEG, VISANGLE)
+
+N = 20000
+
+
+@pytest.mark.parametrize('VisAngle', [None, VISANGLE])
+@pytest.mark.parametrize('IgnoreBlinks', [False, True])
+def test_same_as_online(pylink, IgnoreBlinks, VisAngle):
+    from EyelinkWrapper import EyelinkGetGaze
+    gx, gy, pupil, blinkStart, trials = synthetic(N, pylink.MISSING_DATA)
+    # online values are plain python floats, as pylink delivers them
+    el = SimulatedTracker(gx.tolist(), gy.tolist(), pupil.tolist(),
+                          blinkStart, pylink.STARTBLINK)
+    online = [EyelinkGetGaze(TARGET, FIXLEN, DISPSIZE, el=el,
+                             PixPerDeg=PIXPERDEG, IgnoreBlinks=IgnoreBlinks,
+                             VisAngle=VisAngle)
+              for i in range(N)]
+    offline, perTrial = EyelinkRescoreFixation(
+        gx, gy, pupil, TARGET, FIXLEN, DISPSIZE, PixPerDeg=PIXPERDEG,
+        IgnoreBlinks=IgnoreBlinks, blinkStart=blinkStart, trials=trials,
+        missingValue=pylink.MISSING_DATA, VisAngle=VisAngle)
+    for key in ('hsmvd', 'x', 'y'):
+        ref = np.array([g[key] for g in online], dtype=float)
+        assert np.array_equal(ref, offline[key].astype(float)), key
+    assert 0 < offline['hsmvd'].sum() < N
+
+    hsmvd = np.array([g['hsmvd'] for g in online])
+    for t, aborted, first in zip(perTrial['trial'], perTrial['aborted'],
+                                 perTrial['firstViolation']):
+        inTrial = np.flatnonzero(trials == t)
+        assert aborted == hsmvd[inTrial].any()
+        if aborted:
+            assert first == inTrial[hsmvd[inTrial]][0]
+        else:
+            assert first == -1
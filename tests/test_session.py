@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from psychopy import visual
+
+from EyelinkSession import TrackerSession
+
+DISPSIZE = (1920, 1080)
+
+
+def test_imports_on_python3():
+    # EyelinkSessionAsync needs 3.7+, so EyelinkWrapper (imported by
+    # EyelinkSession above) must be valid Python 3, too
+    assert sys.version_info >= (3, 7)
+    import EyelinkSessionAsync  # noqa: F401
+
+
+def test_start_and_stop(pylink):
+    session = TrackerSession(DISPSIZE, 'sub01', win=visual.Window(DISPSIZE),
+                             dummy=True)
+    with session:
+        el = session.start()
+        assert session.isRecording and el.isRecording
+        session.send_msg(['trialOnset', 1])
+        assert el.messages[-1] == '>\ttrialOnset\t1'
+    assert not session.isRecording
+    assert not el.isRecording and not el.isOpen
+    assert ('closeGraphics',) in pylink.calls
+
+
+def test_send_msg_keeps_marker(pylink):
+    session = TrackerSession(DISPSIZE, 'sub01', el=pylink.EyeLink())
+    session.send_msg(['>', 'trialOnset'])
+    assert session.el.messages == ['>\ttrialOnset']
+
+
+def test_overlapping_sessions_share_graphics(pylink):
+    a = TrackerSession(DISPSIZE, 'subA', win=visual.Window(DISPSIZE),
+                       dummy=True)
+    b = TrackerSession(DISPSIZE, 'subB', win=visual.Window(DISPSIZE),
+                       dummy=True)
+    a.start()
+    b.start()
+    a.stop()
+    assert ('closeGraphics',) not in pylink.calls
+    assert ('endRealTimeMode',) not in pylink.calls
+    # b still calibrates with its own graphics
+    b.calibrate()
+    assert b.el.setups[-1] is b.el.setups[0] is not None
+    b.stop()
+    assert pylink.calls.count(('closeGraphics',)) == 1
+    assert pylink.calls.count(('endRealTimeMode',)) == 1
+    assert pylink.graphics is None
+
+
+def test_concurrent_starts(pylink, monkeypatch):
+    # long enough for the calibrations to overlap without the lock
+    monkeypatch.setattr(pylink, 'DELAY_SCALE', 0.01)
+    sessions = [TrackerSession(DISPSIZE, 'sub%d' % i,
+                               win=visual.Window(DISPSIZE), dummy=True)
+                for i in range(4)]
+    threads = [threading.Thread(target=s.start) for s in sessions]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    graphics = [s.el.setups[0] for s in sessions]
+    assert len(set(map(id, graphics))) == 4
+    for s in sessions:
+        s.calibrate()
+        assert s.el.setups == [s.el.setups[0]] * 2
+    threads = [threading.Thread(target=s.stop) for s in sessions]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert pylink.calls[-1] == ('closeGraphics',)
+    assert pylink.calls.count(('closeGraphics',)) == 1
+    assert pylink.calls.count(('endRealTimeMode',)) == 1
+
+
+def test_stop_during_other_calibration(pylink, monkeypatch):
+    monkeypatch.setattr(pylink, 'DELAY_SCALE', 0.01)
+    a = TrackerSession(DISPSIZE, 'subA', win=visual.Window(DISPSIZE),
+                       dummy=True)
+    a.start()
+    # b calibrates for 0.5 s
+    monkeypatch.setattr(pylink.EyeLink, 'setupTime', 50.0)
+    b = TrackerSession(DISPSIZE, 'subB', win=visual.Window(DISPSIZE),
+                       dummy=True)
+    thread = threading.Thread(target=b.start)
+    thread.start()
+    while not (pylink.getEYELINK() is not a.el and
+               pylink.getEYELINK().setups):
+        time.sleep(0.001)
+    t0 = time.time()
+    a.stop()
+    # a's own delays: 1.5 s + 3 s EDF transfer, scaled
+    assert time.time() - t0 < 0.25
+    assert thread.is_alive()
+    thread.join()
+    b.stop()
+    assert pylink.calls[-1] == ('closeGraphics',)
+
+
+def test_concurrent_stops_create_edf_dir(pylink, monkeypatch):
+    sessions = [TrackerSession(DISPSIZE, 'sub%d' % i,
+                               win=visual.Window(DISPSIZE), dummy=True)
+                for i in range(8)]
+    for s in sessions:
+        s.start()
+    # all stops pass mkdir('./EDF') at the same time
+    barrier = threading.Barrier(len(sessions))
+    mkdir = os.mkdir
+
+    def racingMkdir(name, *args):
+        barrier.wait()
+        return mkdir(name, *args)
+    monkeypatch.setattr('EyelinkWrapper.mkdir', racingMkdir)
+    errors = []
+
+    def stop(s):
+        try:
+            s.stop()
+        except Exception as e:
+            errors.append(e)
+    threads = [threading.Thread(target=stop, args=(s,)) for s in sessions]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert os.path.isdir('EDF')
+    assert not any(s.isRecording for s in sessions)
+
+
+def test_async_session(pylink):
+    from EyelinkSessionAsync import AsyncTrackerSession
+
+    async def run():
+        session = TrackerSession(DISPSIZE, 'sub02',
+                                 win=visual.Window(DISPSIZE), dummy=True)
+        async with AsyncTrackerSession(session) as s:
+            await s.start()
+            await s.send_msg(['trialOnset', 1])
+        return session
+
+    session = asyncio.run(run())
+    assert session.nMessages == 1 and not session.isRecording
+
+
+class ThreadSession(object):
+    """ Records the thread of every call. """
+
+    def __init__(self):
+        self.isRecording = False
+        self.threads = {}
+
+    def _call(self, name):
+        self.threads.setdefault(name, set()).add(threading.get_ident())
+
+    def make_window(self):
+        self._call('window')
+
+    def start(self):
+        self._call('start')
+        self.isRecording = True
+
+    def calibrate(self):
+        self._call('calibrate')
+
+    def drift_check(self):
+        self._call('drift_check')
+
+    def stop(self):
+        self._call('stop')
+        self.isRecording = False
+
+
+@pytest.mark.parametrize('setupInLoop', [False, True])
+def test_async_setup_thread(setupInLoop):
+    from EyelinkSessionAsync import AsyncTrackerSession
+    session = ThreadSession()
+
+    async def run():
+        async with AsyncTrackerSession(session,
+                                       setupInLoop=setupInLoop) as s:
+            if not setupInLoop:
+                await s.run(session.make_window)
+            await s.start()
+            await s.calibrate()
+            await s.drift_check()
+
+    asyncio.run(run())
+    drawing = (session.threads['start'] | session.threads['calibrate'] |
+               session.threads['drift_check'])
+    assert len(drawing) == 1
+    if setupInLoop:
+        # asyncio.run runs the loop in this thread
+        assert drawing == {threading.get_ident()}
+    else:
+        assert drawing == session.threads['window']
+        assert drawing != {threading.get_ident()}